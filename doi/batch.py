@@ -11,7 +11,7 @@ from typing import Optional, Dict, Any, List, Union
 
 from .core import DOI
 from .enums import APISource
-from .utils import clean_data_structure
+from .utils import clean_data_structure, parse_json
 
 
 class DOIBatch:
@@ -83,7 +83,7 @@ class DOIBatch:
                 )
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = parse_json(response)
 
                     # Map results back to original DOIs
                     for idx, paper in enumerate(data):
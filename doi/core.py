@@ -8,6 +8,7 @@ from typing import Optional, Dict, Any, Union
 
 from .exceptions import DOIValidationError, DOIResolutionError, DOIMetadataError
 from .enums import APISource
+from .utils import parse_json
 
 
 class DOI:
@@ -32,6 +33,7 @@ class DOI:
         doi: str,
         validate: bool = True,
         semantic_scholar_api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize a DOI object
@@ -40,6 +42,7 @@ class DOI:
             doi: The DOI string (with or without "doi:" or "https://doi.org/" prefix)
             validate: Whether to validate the DOI format
             semantic_scholar_api_key: Optional Semantic Scholar API key for higher rate limits
+            session: Optional requests.Session to reuse pooled connections
 
         Raises:
             DOIValidationError: If the DOI format is invalid and validate=True
@@ -47,6 +50,7 @@ class DOI:
         self.raw_doi = doi
         self.doi = self._clean_doi(doi)
         self.semantic_scholar_api_key = semantic_scholar_api_key
+        self._http = session or requests
 
         if validate and not self.is_valid():
             raise DOIValidationError(f"Invalid DOI format: {doi}")
@@ -101,7 +105,7 @@ class DOI:
             DOIResolutionError: If the DOI cannot be resolved
         """
         try:
-            response = requests.head(
+            response = self._http.head(
                 self.get_url(), allow_redirects=True, timeout=timeout
             )
             response.raise_for_status()
@@ -126,11 +130,13 @@ class DOI:
         headers = self._get_accept_header(format)
 
         try:
-            response = requests.get(self.get_url(), headers=headers, timeout=timeout)
+            response = self._http.get(
+                self.get_url(), headers=headers, timeout=timeout
+            )
             response.raise_for_status()
 
             if format == "json":
-                return response.json()
+                return parse_json(response)
             else:
                 return response.text
 
@@ -178,14 +184,14 @@ class DOI:
         url = f"{self.CROSSREF_API}/{self.doi}"
 
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self._http.get(url, timeout=timeout)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             return data.get("message", {})
         except requests.RequestException as e:
             raise DOIMetadataError(
                 f"Failed to retrieve CrossRef metadata for DOI {self.doi}: {str(e)}"
-            )
+            ) from e
 
     def get_datacite_metadata(self, timeout: int = 10) -> Dict[str, Any]:
         """
@@ -203,9 +209,9 @@ class DOI:
         url = f"{self.DATACITE_API}/{self.doi}"
 
         try:
-            response = requests.get(url, timeout=timeout)
+            response = self._http.get(url, timeout=timeout)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             return data.get("data", {})
         except requests.RequestException as e:
             raise DOIMetadataError(
@@ -229,7 +235,9 @@ class DOI:
         headers = {"Accept": f"text/x-bibliography; style={style}"}
 
         try:
-            response = requests.get(self.get_url(), headers=headers, timeout=timeout)
+            response = self._http.get(
+                self.get_url(), headers=headers, timeout=timeout
+            )
             response.raise_for_status()
             return response.text.strip()
         except requests.RequestException as e:
@@ -304,12 +312,12 @@ class DOI:
             if self.semantic_scholar_api_key:
                 headers["x-api-key"] = self.semantic_scholar_api_key
 
-            response = requests.get(
+            response = self._http.get(
                 semantic_scholar_url, params=params, headers=headers, timeout=timeout
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if "abstract" in data and data["abstract"]:
                     return data["abstract"].strip()
         except Exception:
@@ -7,6 +7,7 @@ import time
 from typing import Optional, Dict, Any, List
 
 from .exceptions import DOIError
+from .utils import parse_json
 
 
 class DOIQuery:
@@ -16,14 +17,18 @@ class DOIQuery:
 
     CROSSREF_WORKS_API = "https://api.crossref.org/works"
 
-    def __init__(self, mailto: Optional[str] = None):
+    def __init__(
+        self, mailto: Optional[str] = None, session: Optional[requests.Session] = None
+    ):
         """
         Initialize a DOI query object
 
         Args:
             mailto: Email address for polite API access (recommended)
+            session: Optional requests.Session to reuse pooled connections
         """
         self.mailto = mailto
+        self._http = session or requests
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
@@ -69,14 +74,14 @@ class DOIQuery:
             params["order"] = order
 
         try:
-            response = requests.get(
+            response = self._http.get(
                 self.CROSSREF_WORKS_API,
                 params=params,
                 headers=self._get_headers(),
                 timeout=timeout,
             )
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except requests.RequestException as e:
             raise DOIError(f"Search failed: {str(e)}")
 
@@ -113,17 +118,62 @@ class DOIQuery:
         }
 
         try:
-            response = requests.get(
+            response = self._http.get(
                 self.CROSSREF_WORKS_API,
                 params=params,
                 headers=self._get_headers(),
                 timeout=timeout,
             )
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except requests.RequestException as e:
             raise DOIError(f"Filter query failed: {str(e)}")
 
+    def get_works_by_doi(
+        self,
+        dois: List[str],
+        select: Optional[List[str]] = None,
+        timeout: int = 10,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metadata for several DOIs with a single filter query
+
+        Args:
+            dois: Cleaned DOI strings (e.g., "10.1234/example"); must not contain commas
+            select: Optional list of fields to return (e.g., ["DOI", "title"])
+            timeout: Request timeout in seconds
+
+        Returns:
+            Dictionary mapping lower-cased DOI to its CrossRef metadata. DOIs
+            unknown to CrossRef are missing from the result.
+
+        Raises:
+            DOIError: If the query fails
+        """
+        if not dois:
+            return {}
+
+        params = {
+            "filter": ",".join(f"doi:{doi}" for doi in dois),
+            "rows": len(dois),
+        }
+        if select:
+            params["select"] = ",".join(select)
+
+        try:
+            response = self._http.get(
+                self.CROSSREF_WORKS_API,
+                params=params,
+                headers=self._get_headers(),
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            items = parse_json(response).get("message", {}).get("items", [])
+        except requests.RequestException as e:
+            raise DOIError(f"DOI batch query failed: {str(e)}")
+
+        return {item["DOI"].lower(): item for item in items if item.get("DOI")}
+
 
 class SemanticScholarSearch:
     """
@@ -135,14 +185,18 @@ class SemanticScholarSearch:
 
     BULK_SEARCH_API = "https://api.semanticscholar.org/graph/v1/paper/search/bulk"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self, api_key: Optional[str] = None, session: Optional[requests.Session] = None
+    ):
         """
         Initialize a Semantic Scholar search object
 
         Args:
             api_key: Optional Semantic Scholar API key for higher rate limits
+            session: Optional requests.Session to reuse pooled connections
         """
         self.api_key = api_key
+        self._http = session or requests
 
     def _get_headers(self) -> Dict[str, str]:
         """Get headers for API requests"""
@@ -225,14 +279,14 @@ class SemanticScholarSearch:
             params["token"] = token
 
         try:
-            response = requests.get(
+            response = self._http.get(
                 self.BULK_SEARCH_API,
                 params=params,
                 headers=self._get_headers(),
                 timeout=timeout,
             )
             response.raise_for_status()
-            return response.json()
+            return parse_json(response)
         except requests.RequestException as e:
             raise DOIError(f"Semantic Scholar bulk search failed: {str(e)}")
 
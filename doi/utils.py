@@ -4,6 +4,38 @@ Utility functions for data cleaning and text processing
 
 from typing import Optional, Any, List, Dict
 
+import requests
+
+# orjson is optional; it parses API responses noticeably faster than json
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Parse a JSON API response, using orjson when it is installed
+
+    Args:
+        response: HTTP response with a UTF-8 JSON body
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        requests.exceptions.JSONDecodeError: If the body is not valid JSON
+    """
+    if not _HAVE_ORJSON:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Same exception type as response.json(), so callers' handlers still apply
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
 
 def clean_text_for_csv(text: Optional[str]) -> Optional[str]:
     """
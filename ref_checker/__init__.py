@@ -7,6 +7,7 @@ Supports both DOI validation and title-based search using Semantic Scholar.
 
 from .extractor import ReferenceExtractor
 from .checker import ReferenceChecker
+from .result import RefResult
 from .reporter import ReportGenerator
 from .batch import BatchProcessor
 
@@ -14,6 +15,7 @@ __version__ = "1.0.0"
 __all__ = [
     "ReferenceExtractor",
     "ReferenceChecker",
+    "RefResult",
     "ReportGenerator",
     "BatchProcessor",
 ]
@@ -71,6 +71,16 @@ Examples:
         help="Semantic Scholar API key for higher rate limits",
         default=None,
     )
+    parser.add_argument(
+        "--mailto",
+        default=None,
+        help="Contact email sent to CrossRef for faster polite-pool access",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for a persistent cache of verified results (default: no cache)",
+    )
     parser.add_argument(
         "--batch",
         action="store_true",
@@ -107,6 +117,9 @@ Examples:
     if api_key == "your_api_key_here":
         api_key = None
 
+    # Get CrossRef contact email from command line or environment variable
+    args.mailto = args.mailto or os.getenv("CROSSREF_MAILTO")
+
     try:
         if is_batch_mode:
             # ============================================
@@ -170,8 +183,16 @@ def run_single_mode(pdf_path: Path, args, api_key: str):
         )
 
     # Check references
-    checker = ReferenceChecker(timeout=args.timeout, semantic_scholar_api_key=api_key)
-    results = checker.check_references(references, verbose=not args.quiet)
+    checker = ReferenceChecker(
+        timeout=args.timeout,
+        semantic_scholar_api_key=api_key,
+        cache_dir=args.cache_dir,
+        mailto=args.mailto,
+    )
+    try:
+        results = checker.check_references(references, verbose=not args.quiet)
+    finally:
+        checker.close()
 
     # Print summary
     checker.print_report()
@@ -194,7 +215,11 @@ def run_batch_mode(folder: Path, args, api_key: str):
 
     # Create batch processor
     processor = BatchProcessor(
-        api_key=api_key, timeout=args.timeout, verbose=not args.quiet
+        api_key=api_key,
+        timeout=args.timeout,
+        verbose=not args.quiet,
+        cache_dir=args.cache_dir,
+        mailto=args.mailto,
     )
 
     # Process all PDFs in folder
@@ -22,6 +22,8 @@ class BatchProcessor:
         api_key: Optional[str] = None,
         timeout: int = 10,
         verbose: bool = True,
+        cache_dir: Optional[str] = None,
+        mailto: Optional[str] = None,
     ):
         """
         Initialize the batch processor
@@ -30,10 +32,14 @@ class BatchProcessor:
             api_key: Optional Semantic Scholar API key
             timeout: Timeout for API requests in seconds
             verbose: Whether to print progress messages
+            cache_dir: Optional directory for a persistent cache of verified results
+            mailto: Optional contact email sent to CrossRef
         """
         self.api_key = api_key
         self.timeout = timeout
         self.verbose = verbose
+        self.cache_dir = cache_dir
+        self.mailto = mailto
         self.results: List[Dict[str, Any]] = []
 
     def process_pdf(self, pdf_path: Path, output_dir: Path) -> Dict[str, Any]:
@@ -77,9 +83,15 @@ class BatchProcessor:
 
             # Check references
             checker = ReferenceChecker(
-                timeout=self.timeout, semantic_scholar_api_key=self.api_key
+                timeout=self.timeout,
+                semantic_scholar_api_key=self.api_key,
+                cache_dir=self.cache_dir,
+                mailto=self.mailto,
             )
-            checker.check_references(references, verbose=False)
+            try:
+                checker.check_references(references, verbose=False)
+            finally:
+                checker.close()
             results = checker.results  # List of reference dicts
 
             # Calculate statistics
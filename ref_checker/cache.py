@@ -0,0 +1,103 @@
+"""
+Persistent result cache.
+
+This module stores successful reference check results on disk so that
+re-running the checker (e.g. on a revised manuscript) does not query the
+APIs again for DOIs and titles that were already resolved.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+# Cached results expire after 30 days
+DEFAULT_TTL = 30 * 86400
+
+
+class ResultCache:
+    """SQLite-backed key/value cache for check results with a time-to-live"""
+
+    def __init__(self, cache_dir: str, ttl: int = DEFAULT_TTL):
+        """
+        Open (or create) the cache in a directory
+
+        Args:
+            cache_dir: Directory holding the cache database
+            ttl: Time-to-live of cached entries in seconds
+        """
+        path = Path(cache_dir)
+        path.mkdir(parents=True, exist_ok=True)
+
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(path / "results.sqlite3"), check_same_thread=False
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(kind: str, parts: Sequence) -> Tuple[str, str]:
+        """
+        Build the cache key for a lookup
+
+        Args:
+            kind: Kind of lookup ("doi" or "title")
+            parts: Every input the lookup's result depends on
+
+        Returns:
+            Cache key tuple
+        """
+        digest = hashlib.blake2b(
+            json.dumps(list(parts), ensure_ascii=False).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        return (kind, digest)
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            A fresh copy of the cached result, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM results WHERE key = ?",
+                (":".join(key),),
+            ).fetchone()
+
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: Tuple[str, str], result: Mapping) -> None:
+        """
+        Store a result in the cache
+
+        Args:
+            key: Cache key from make_key()
+            result: Check result mapping (values must be JSON-serializable)
+        """
+        value = json.dumps(dict(result), ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires) VALUES (?, ?, ?)",
+                (":".join(key), value, time.time() + self.ttl),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
@@ -5,11 +5,22 @@ This module handles DOI validation and title-based paper search using
 Semantic Scholar and CrossRef APIs.
 """
 
+import asyncio
+import multiprocessing
+import random
 import re
+import string
+import sys
+import threading
 import time
-from typing import List, Dict, Optional
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 from doi import DOI, validate_doi
 from doi.exceptions import (
@@ -18,15 +29,398 @@ from doi.exceptions import (
     DOIMetadataError,
     DOIError,
 )
-from doi.query import SemanticScholarSearch
+from doi.query import DOIQuery, SemanticScholarSearch
+from doi.utils import parse_json
 from doi.batch import DOIBatch
 
+from .cache import ResultCache
+from .result import RefResult
+
+# Candidate scoring is only offloaded to worker processes for batches larger
+# than this; below it, process start-up and pickling cost more than they save
+PROCESS_POOL_MIN_REFS = 200
+
+# Start method for the scoring pool. Scoring runs on an executor thread while
+# other threads hold HTTP sockets and locks, so the process must not be forked.
+_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# HTTP status codes worth retrying a CrossRef request for (rate limit / server trouble)
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# Backoff factor for retried CrossRef requests (sleeps 0.5s, 1s, 2s, ...)
+RETRY_BACKOFF_FACTOR = 0.5
+
+# Up to this many seconds of random jitter are added to each CrossRef backoff,
+# so workers rate-limited at the same moment don't retry in lockstep
+RETRY_JITTER = 1.0
+
+# User-Agent sent with every request; CrossRef routes clients that include a
+# mailto address to its faster "polite" pool
+USER_AGENT = "ref-checker/1.0"
+
+# Minimum spacing of Semantic Scholar searches across all threads, in seconds
+S2_MIN_INTERVAL = 1.0
+
+# Retries of a rate-limited (429) title search; backs off 5s, 10s, 20s
+S2_RATE_LIMIT_RETRIES = 3
+
+# Number of DOIs fetched per CrossRef filter query
+DOI_PREFETCH_CHUNK = 20
+
+# CrossRef fields needed to build a DOI check result
+_CROSSREF_FIELDS = ["DOI", "title", "author", "published", "published-print"]
+
+# A run of at least four letters; titles without one never resolve
+_ALPHA_RUN_RE = re.compile(r"[^\W\d_]{4,}")
+
+# Summary printed by ReferenceChecker.print_report(), filled from generate_report()
+_RULE = "=" * 70
+_REPORT_TMPL = (
+    f"\n{_RULE}\n"
+    "REFERENCE CHECK SUMMARY\n"
+    f"{_RULE}\n"
+    "Total references found:        {total_references}\n"
+    "Valid DOI format:              {valid_format}\n"
+    "Invalid DOI format:            {invalid_format}\n"
+    "References verified (exist):   {exists}\n"
+    "References not found:          {not_found}\n"
+    "References with errors:        {errors}\n"
+    "Success rate:                  {success_rate:.1f}%\n"
+    f"{_RULE}\n\n"
+)
+
+# Translation table that drops ASCII punctuation
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+
+@lru_cache(maxsize=4096)
+def _norm_title(title: str) -> str:
+    """
+    Normalize a title for word-overlap comparison
+
+    Strips accents (NFKD decomposition without combining marks), case-folds
+    and removes punctuation, so e.g. "Observatoire" matches "observatoire"
+    and "Straße" matches "strasse".
+
+    Args:
+        title: Title to normalize
+
+    Returns:
+        Normalized title
+    """
+    decomposed = unicodedata.normalize("NFKD", title)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.casefold().translate(_PUNCT_TABLE)
+
+
+def _dedupe(keys: List[tuple]) -> Tuple[List[int], List[int]]:
+    """
+    Group items with equal keys so each distinct query is sent only once
+
+    Args:
+        keys: One hashable key per item
+
+    Returns:
+        Tuple of (index of the first item for each distinct key,
+        position in that list for every item)
+    """
+    slots: Dict[tuple, int] = {}
+    firsts = []
+    positions = []
+    for idx, key in enumerate(keys):
+        slot = slots.get(key)
+        if slot is None:
+            slot = slots[key] = len(firsts)
+            firsts.append(idx)
+        positions.append(slot)
+    return firsts, positions
+
+
+def _fan_out(unique_results: List, positions: List[int]) -> List:
+    """
+    Expand results of deduplicated queries back to one result per item
+
+    Repeated items get their own copy so per-reference fields can be set
+    without affecting the others.
+
+    Args:
+        unique_results: One result (or exception) per distinct key
+        positions: Position in unique_results for every item, from _dedupe()
+
+    Returns:
+        List with one result per item
+    """
+    results = []
+    used = set()
+    for slot in positions:
+        result = unique_results[slot]
+        if slot in used and isinstance(result, RefResult):
+            result = result.copy()
+        used.add(slot)
+        results.append(result)
+    return results
+
+
+def _verify_author_match(ref_text: str, match_authors: List[Dict]) -> bool:
+    """
+    Verify at least one author surname matches between reference and search result
+
+    Args:
+        ref_text: Original reference text containing author names
+        match_authors: List of author dicts from search result
+
+    Returns:
+        True if at least one author surname matches, or if verification not possible
+    """
+    if not match_authors:
+        return True  # Can't verify, accept match
+
+    # Extract surnames from reference text
+    # Look for capitalized words at the start (before year or title)
+    ref_surnames = set()
+
+    # Common patterns: "Surname, Initial" or "Initial. Surname"
+    author_patterns = [
+        r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]",  # "Hassenzahl, M."
+        r"\b[A-Z]\.\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)",  # "M. Hassenzahl"
+        r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+and\b",  # "Hassenzahl and"
+    ]
+
+    for pattern in author_patterns:
+        for match in re.finditer(pattern, ref_text):
+            surname = match.group(1).lower()
+            if len(surname) > 2:  # Skip initials
+                ref_surnames.add(surname)
+
+    if not ref_surnames:
+        return True  # Couldn't extract author names, accept match
+
+    # Check if any surname appears in match authors
+    for author in match_authors:
+        author_name = author.get("name", "").lower()
+        for surname in ref_surnames:
+            if surname in author_name:
+                return True
+
+    return False  # No author match found
+
+
+def _title_batch_result(title: str, year: Optional[int]) -> RefResult:
+    """
+    Create an empty result for a batch title search
+
+    Args:
+        title: Title that was searched for
+        year: Publication year from the reference, if any
+
+    Returns:
+        Dictionary with default check result fields
+    """
+    return RefResult(
+        doi=None,
+        title=title,
+        search_method="title_batch",
+        valid_format=None,
+        exists=False,
+        matched_title=None,
+        authors=None,
+        year=year,
+        confidence=None,
+        error=None,
+    )
+
+
+def _score_candidates(ref: Dict[str, Optional[str]], papers: List[Dict]) -> RefResult:
+    """
+    Score search candidates for a reference and build its check result.
+
+    This is pure CPU work, kept at module level so it can be pickled and
+    mapped over a ProcessPoolExecutor for large batches.
+
+    Args:
+        ref: Reference dictionary (title, year, raw_text)
+        papers: Candidate papers returned by the title search
+
+    Returns:
+        Dictionary with check results including confidence level
+    """
+    title = ref.get("title", "")
+    year = ref.get("year")
+    result = _title_batch_result(title, year)
+
+    # Tokenize the reference title once for all candidates
+    title_words = frozenset(_norm_title(title).split())
+
+    try:
+        # Multi-result evaluation: Score each paper and pick the best
+        best_match = None
+        best_score = -1
+
+        for paper in papers[:5]:  # Examine top 5 results
+            score = 0
+            paper_title = _norm_title(paper.get("title", ""))
+            paper_year = paper.get("year")
+            paper_authors = paper.get("authors", [])
+
+            # Calculate title similarity (0-100 points)
+            paper_words = set(paper_title.split())
+            title_overlap = len(title_words & paper_words) / max(len(title_words), 1)
+            score += title_overlap * 100
+
+            # Author match bonus (30 points)
+            if _verify_author_match(ref.get("raw_text", ""), paper_authors):
+                score += 30
+
+            # Year proximity bonus (20 points max, decays with distance)
+            if year and paper_year:
+                year_diff = abs(year - paper_year)
+                if year_diff == 0:
+                    score += 20
+                elif year_diff == 1:
+                    score += 15
+                elif year_diff == 2:
+                    score += 10
+                elif year_diff <= 5:
+                    score += 5
+
+            # Citation count tie-breaker (up to 10 points)
+            citation_count = paper.get("citationCount", 0)
+            if citation_count:
+                score += min(citation_count / 100, 10)
+
+            if score > best_score:
+                best_score = score
+                best_match = paper
+
+        # Calculate title overlap for diagnostics
+        matched_title = best_match.get("title", "")
+        matched_words = set(_norm_title(matched_title).split())
+        overlap = len(title_words & matched_words) / max(len(title_words), 1)
+
+        # Verify author match
+        authors = best_match.get("authors", [])
+        author_match = _verify_author_match(ref.get("raw_text", ""), authors)
+
+        # Reject if no author match and overlap is not very high
+        if not author_match and overlap < 0.9:
+            # Add diagnostic information
+            ref_text = ref.get("raw_text", "")
+            ref_authors = []
+
+            # Extract author surnames from reference text
+            for pattern in [
+                r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]",
+                r"\b[A-Z]\.\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)",
+                r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+and\b",
+            ]:
+                for match in re.finditer(pattern, ref_text[:200]):
+                    surname = match.group(1)
+                    if len(surname) > 2 and surname not in ref_authors:
+                        ref_authors.append(surname)
+
+            ref_author_str = (
+                ", ".join(ref_authors[:5]) if ref_authors else "Unable to extract"
+            )
+
+            # Get matched paper authors
+            author_names = [a.get("name", "") for a in authors[:5]]
+            author_list = ", ".join(author_names) if author_names else "None"
+
+            result["error"] = (
+                f"No author match (overlap: {overlap:.1%}). "
+                f"Reference authors: [{ref_author_str}], Found: [{author_list}]"
+            )
+            result["matched_title"] = matched_title
+            result["authors"] = author_list
+            result["confidence"] = None
+            if best_match.get("year"):
+                result["year"] = best_match.get("year")
+            return result
+
+        # Determine confidence based on scoring system
+        if best_score >= 120:
+            confidence = "high"
+        elif best_score >= 90:
+            confidence = "medium"
+        elif best_score >= 70:
+            confidence = "low"
+        else:
+            # Reject matches below score threshold
+            result["error"] = (
+                f"Match quality too low (score: {best_score:.1f}/160, overlap: {overlap:.1%}). "
+                f"Expected: '{title[:80]}...', Found: '{matched_title[:80]}...'"
+            )
+            result["matched_title"] = matched_title
+            result["confidence"] = None
+
+            if authors:
+                author_names = [a.get("name", "") for a in authors[:5]]
+                result["authors"] = ", ".join(author_names)
+
+            if best_match.get("year"):
+                result["year"] = best_match.get("year")
+
+            external_ids = best_match.get("externalIds", {})
+            if external_ids and "DOI" in external_ids:
+                result["doi"] = external_ids["DOI"]
+
+            return result
+
+        result["exists"] = True
+        result["matched_title"] = matched_title
+        result["confidence"] = confidence
+
+        # Extract DOI if available
+        external_ids = best_match.get("externalIds", {})
+        if external_ids and "DOI" in external_ids:
+            result["doi"] = external_ids["DOI"]
+
+        # Extract authors
+        if authors:
+            author_names = []
+            for author in authors[:3]:
+                author_names.append(author.get("name", ""))
+            if len(authors) > 3:
+                author_names.append("et al.")
+            result["authors"] = ", ".join(author_names)
+
+        # Get year from match if not provided
+        if not result["year"]:
+            result["year"] = best_match.get("year")
+
+    except Exception as e:
+        result["error"] = f"Unexpected error: {str(e)}"
+
+    return result
+
+
+class _JitteredRetry(Retry):
+    """urllib3 Retry whose backoff adds up to RETRY_JITTER seconds of jitter"""
+
+    def get_backoff_time(self) -> float:
+        """
+        Compute the sleep before the next retry
+
+        Returns:
+            Exponential backoff plus random jitter, in seconds
+        """
+        return super().get_backoff_time() + random.random() * RETRY_JITTER
+
 
 class ReferenceChecker:
     """Check validity of references using DOI lookup and title-based search"""
 
     def __init__(
-        self, timeout: int = 10, semantic_scholar_api_key: Optional[str] = None
+        self,
+        timeout: int = 10,
+        semantic_scholar_api_key: Optional[str] = None,
+        max_concurrency: int = 10,
+        max_retries: int = 3,
+        cache_dir: Optional[str] = None,
+        mailto: Optional[str] = None,
+        workers: int = 16,
     ):
         """
         Initialize the reference checker
@@ -34,74 +428,95 @@ class ReferenceChecker:
         Args:
             timeout: Timeout for DOI API requests in seconds
             semantic_scholar_api_key: Optional Semantic Scholar API key for higher rate limits
+            max_concurrency: Maximum number of DOI lookups in flight at once
+            max_retries: Retries per CrossRef request on rate-limit or server errors
+            cache_dir: Optional directory for a persistent cache of verified results
+            mailto: Optional contact email sent to CrossRef for polite-pool access
+            workers: Number of threads running blocking HTTP lookups
         """
         self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.workers = workers
+        self.max_retries = max_retries
+        self._cache = ResultCache(cache_dir) if cache_dir else None
+        self._session = self._build_session(mailto)
         self.semantic_scholar_api_key = semantic_scholar_api_key
-        self.semantic_scholar = SemanticScholarSearch(api_key=semantic_scholar_api_key)
-        self.results: List[Dict] = []
+        self.semantic_scholar = SemanticScholarSearch(
+            api_key=semantic_scholar_api_key, session=self._session
+        )
+        self.results: List[RefResult] = []
 
-    def _verify_author_match(self, ref_text: str, match_authors: List[Dict]) -> bool:
+        # Semantic Scholar searches from any thread are spaced by _wait_for_s2()
+        self._s2_lock = threading.Lock()
+        self._s2_next = 0.0
+
+    def _build_session(self, mailto: Optional[str]) -> requests.Session:
         """
-        Verify at least one author surname matches between reference and search result
+        Create the HTTP session shared by all lookups
+
+        Connections are pooled and kept alive across requests. CrossRef
+        requests are retried with jittered exponential backoff on 429/5xx,
+        honoring Retry-After; Semantic Scholar requests are spaced by
+        _wait_for_s2() and the title searches back off on 429 themselves.
 
         Args:
-            ref_text: Original reference text containing author names
-            match_authors: List of author dicts from search result
+            mailto: Optional contact email for the User-Agent header
 
         Returns:
-            True if at least one author surname matches, or if verification not possible
+            Configured requests.Session
         """
-        if not match_authors:
-            return True  # Can't verify, accept match
-
-        # Extract surnames from reference text
-        # Look for capitalized words at the start (before year or title)
-        ref_surnames = set()
-
-        # Common patterns: "Surname, Initial" or "Initial. Surname"
-        author_patterns = [
-            r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]",  # "Hassenzahl, M."
-            r"\b[A-Z]\.\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)",  # "M. Hassenzahl"
-            r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+and\b",  # "Hassenzahl and"
-        ]
-
-        for pattern in author_patterns:
-            for match in re.finditer(pattern, ref_text):
-                surname = match.group(1).lower()
-                if len(surname) > 2:  # Skip initials
-                    ref_surnames.add(surname)
-
-        if not ref_surnames:
-            return True  # Couldn't extract author names, accept match
-
-        # Check if any surname appears in match authors
-        for author in match_authors:
-            author_name = author.get("name", "").lower()
-            for surname in ref_surnames:
-                if surname in author_name:
-                    return True
+        pool_size = max(self.max_concurrency, 10)
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size),
+        )
+        session.mount(
+            "https://api.crossref.org/",
+            HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=_JitteredRetry(
+                    total=self.max_retries,
+                    backoff_factor=RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RETRYABLE_STATUS,
+                    raise_on_status=False,
+                ),
+            ),
+        )
+        session.headers["User-Agent"] = (
+            f"{USER_AGENT} (mailto:{mailto})" if mailto else USER_AGENT
+        )
+        return session
 
-        return False  # No author match found
+    def _wait_for_s2(self) -> None:
+        """Block until the next Semantic Scholar search may be sent"""
+        with self._s2_lock:
+            delay = self._s2_next - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._s2_next = time.monotonic() + S2_MIN_INTERVAL
 
-    def check_doi(self, doi_string: str) -> Dict:
+    def check_doi(self, doi_string: str, metadata: Optional[Dict] = None) -> RefResult:
         """
         Check a single DOI for validity and retrieve metadata
 
         Args:
             doi_string: DOI string to check
+            metadata: CrossRef metadata already fetched for this DOI, if any
 
         Returns:
             Dictionary with check results including title, authors, year
         """
-        result = {
-            "doi": doi_string,
-            "valid_format": False,
-            "exists": False,
-            "title": None,
-            "authors": None,
-            "year": None,
-            "error": None,
-        }
+        result = RefResult(
+            doi=doi_string,
+            valid_format=False,
+            exists=False,
+            title=None,
+            authors=None,
+            year=None,
+            error=None,
+        )
 
         try:
             # Validate format
@@ -112,9 +527,10 @@ class ReferenceChecker:
                 return result
 
             # Try to get metadata (this checks if DOI exists)
-            doi_obj = DOI(doi_string)
+            doi_obj = DOI(doi_string, session=self._session)
             try:
-                metadata = doi_obj.get_crossref_metadata(timeout=self.timeout)
+                if metadata is None:
+                    metadata = doi_obj.get_crossref_metadata(timeout=self.timeout)
                 result["exists"] = True
 
                 # Extract key information
@@ -151,7 +567,7 @@ class ReferenceChecker:
 
         return result
 
-    def check_by_title(self, title: str, year: Optional[int] = None) -> Dict:
+    def check_by_title(self, title: str, year: Optional[int] = None) -> RefResult:
         """
         Check a reference by searching for its title using Semantic Scholar
 
@@ -162,27 +578,24 @@ class ReferenceChecker:
         Returns:
             Dictionary with check results including confidence level
         """
-        result = {
-            "doi": None,
-            "title": title,
-            "search_method": "title",
-            "valid_format": None,
-            "exists": False,
-            "matched_title": None,
-            "authors": None,
-            "year": year,
-            "confidence": None,
-            "error": None,
-        }
+        result = RefResult(
+            doi=None,
+            title=title,
+            search_method="title",
+            valid_format=None,
+            exists=False,
+            matched_title=None,
+            authors=None,
+            year=year,
+            confidence=None,
+            error=None,
+        )
 
         if not title or len(title) < 10:
             result["error"] = "Title too short or missing"
             return result
 
         try:
-            # Add delay to avoid rate limiting
-            time.sleep(1.0)
-
             # Search Semantic Scholar for the title
             # Use the paper search API directly
             search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
@@ -196,11 +609,17 @@ class ReferenceChecker:
             if self.semantic_scholar_api_key:
                 headers["x-api-key"] = self.semantic_scholar_api_key
 
-            response = requests.get(
-                search_url, params=params, headers=headers, timeout=self.timeout
-            )
+            # Space out requests to avoid rate limiting; back off when limited anyway
+            for attempt in range(S2_RATE_LIMIT_RETRIES + 1):
+                self._wait_for_s2()
+                response = self._session.get(
+                    search_url, params=params, headers=headers, timeout=self.timeout
+                )
+                if response.status_code != 429 or attempt == S2_RATE_LIMIT_RETRIES:
+                    break
+                time.sleep(5.0 * (2**attempt))
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
 
             papers = data.get("data", [])
 
@@ -261,9 +680,27 @@ class ReferenceChecker:
 
         return result
 
+    @staticmethod
+    def _build_query(title: str, raw_text: str) -> str:
+        """
+        Build a title search query, prefixed with the first author's surname if found
+
+        Args:
+            title: Title of the paper to search for
+            raw_text: Original reference text
+
+        Returns:
+            Search query string
+        """
+        if raw_text:
+            author_match = re.match(r"^([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]", raw_text)
+            if author_match:
+                return f"{author_match.group(1)} {title}"
+        return title
+
     def check_by_title_batch(
         self, references_with_titles: List[Dict[str, Optional[str]]]
-    ) -> List[Dict]:
+    ) -> List[RefResult]:
         """
         Check multiple references by title using Semantic Scholar bulk search API.
         Implements multi-result evaluation with intelligent scoring.
@@ -280,19 +717,25 @@ class ReferenceChecker:
         - Low: score >= 70
         - Reject: score < 70
 
+        Candidates are scored once all searches are done; batches larger than
+        PROCESS_POOL_MIN_REFS are scored in a process pool.
+
         Args:
             references_with_titles: List of reference dictionaries with titles
 
         Returns:
             List of check results in the same order as input
         """
-        results = []
-
         if not references_with_titles:
-            return results
+            return []
+
+        # One slot per reference, filled by position
+        results = [None] * len(references_with_titles)
 
         # Use SemanticScholarSearch with bulk API
-        searcher = SemanticScholarSearch(api_key=self.semantic_scholar_api_key)
+        searcher = SemanticScholarSearch(
+            api_key=self.semantic_scholar_api_key, session=self._session
+        )
 
         # Rate limiting configuration
         # Without API key: 100 requests per 5 minutes = ~0.33 req/sec → use 0.5 req/sec to be safe
@@ -305,6 +748,10 @@ class ReferenceChecker:
         consecutive_429_errors = 0
         max_retries = 5
 
+        # References with search results, waiting to be scored:
+        # (position in results, reference, candidate papers)
+        pending = []
+
         # Create progress bar
         pbar = tqdm(
             total=len(references_with_titles),
@@ -317,44 +764,30 @@ class ReferenceChecker:
             title = ref.get("title", "")
             year = ref.get("year")
 
-            result = {
-                "doi": None,
-                "title": title,
-                "search_method": "title_batch",
-                "valid_format": None,
-                "exists": False,
-                "matched_title": None,
-                "authors": None,
-                "year": year,
-                "confidence": None,
-                "error": None,
-            }
+            result = _title_batch_result(title, year)
 
             if not title or len(title) < 10:
                 result["error"] = "Title too short or missing"
-                results.append(result)
+                results[idx - 1] = result
                 pbar.update(1)
                 continue
 
+            # Skip the search for things like "1999. 12(3):45-67" that have no words
+            if not _ALPHA_RUN_RE.search(title):
+                result["error"] = "Title contains no words to search for"
+                results[idx - 1] = result
+                pbar.update(1)
+                continue
+
+            # Build the search query once; it is the same for every retry
+            query = self._build_query(title, ref.get("raw_text", ""))
+
             # Retry logic with exponential backoff
             retry_count = 0
             success = False
 
             while retry_count < max_retries and not success:
                 try:
-                    # Add author surname to search query for better results
-                    raw_text = ref.get("raw_text", "")
-                    query = title
-
-                    # Try to extract first author surname and add to query
-                    if raw_text:
-                        author_match = re.match(
-                            r"^([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]", raw_text
-                        )
-                        if author_match:
-                            author_surname = author_match.group(1)
-                            query = f"{author_surname} {title}"
-
                     # Use bulk search API for better efficiency
                     # Search with title and optionally year filter
                     search_params = {
@@ -373,6 +806,7 @@ class ReferenceChecker:
                     if year:
                         search_params["year"] = f"{year-2}-{year+2}"
 
+                    self._wait_for_s2()
                     search_results = searcher.bulk_search(
                         **search_params, timeout=self.timeout
                     )
@@ -382,6 +816,7 @@ class ReferenceChecker:
                     if not papers and year:
                         search_params_no_year = search_params.copy()
                         del search_params_no_year["year"]
+                        self._wait_for_s2()
                         search_results = searcher.bulk_search(
                             **search_params_no_year, timeout=self.timeout
                         )
@@ -391,168 +826,12 @@ class ReferenceChecker:
                         result["error"] = (
                             f"No matching papers found (searched: '{query[:100]}...' in Semantic Scholar)"
                         )
-                        results.append(result)
+                        results[idx - 1] = result
                         success = True
                         continue
 
-                    # Multi-result evaluation: Score each paper and pick the best
-                    best_match = None
-                    best_score = -1
-
-                    for paper in papers[:5]:  # Examine top 5 results
-                        score = 0
-                        paper_title = paper.get("title", "").lower()
-                        paper_year = paper.get("year")
-                        paper_authors = paper.get("authors", [])
-
-                        # Calculate title similarity (0-100 points)
-                        title_words = set(title.lower().split())
-                        paper_words = set(paper_title.split())
-                        title_overlap = len(title_words & paper_words) / max(
-                            len(title_words), 1
-                        )
-                        score += title_overlap * 100
-
-                        # Author match bonus (30 points)
-                        if self._verify_author_match(
-                            ref.get("raw_text", ""), paper_authors
-                        ):
-                            score += 30
-
-                        # Year proximity bonus (20 points max, decays with distance)
-                        if year and paper_year:
-                            year_diff = abs(year - paper_year)
-                            if year_diff == 0:
-                                score += 20
-                            elif year_diff == 1:
-                                score += 15
-                            elif year_diff == 2:
-                                score += 10
-                            elif year_diff <= 5:
-                                score += 5
-
-                        # Citation count tie-breaker (up to 10 points)
-                        citation_count = paper.get("citationCount", 0)
-                        if citation_count:
-                            score += min(citation_count / 100, 10)
-
-                        if score > best_score:
-                            best_score = score
-                            best_match = paper
-
-                    # Calculate title overlap for diagnostics
-                    matched_title = best_match.get("title", "")
-                    title_lower = title.lower()
-                    matched_lower = matched_title.lower()
-
-                    title_words = set(title_lower.split())
-                    matched_words = set(matched_lower.split())
-                    overlap = len(title_words & matched_words) / max(
-                        len(title_words), 1
-                    )
-
-                    # Verify author match
-                    authors = best_match.get("authors", [])
-                    author_match = self._verify_author_match(
-                        ref.get("raw_text", ""), authors
-                    )
-
-                    # Reject if no author match and overlap is not very high
-                    if not author_match and overlap < 0.9:
-                        # Add diagnostic information
-                        ref_text = ref.get("raw_text", "")
-                        ref_authors = []
-
-                        # Extract author surnames from reference text
-                        for pattern in [
-                            r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]",
-                            r"\b[A-Z]\.\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?)",
-                            r"\b([A-Z][a-z]+(?:-[A-Z][a-z]+)?)\s+and\b",
-                        ]:
-                            for match in re.finditer(pattern, ref_text[:200]):
-                                surname = match.group(1)
-                                if len(surname) > 2 and surname not in ref_authors:
-                                    ref_authors.append(surname)
-
-                        ref_author_str = (
-                            ", ".join(ref_authors[:5])
-                            if ref_authors
-                            else "Unable to extract"
-                        )
-
-                        # Get matched paper authors
-                        author_names = [a.get("name", "") for a in authors[:5]]
-                        author_list = (
-                            ", ".join(author_names) if author_names else "None"
-                        )
-
-                        result["error"] = (
-                            f"No author match (overlap: {overlap:.1%}). "
-                            f"Reference authors: [{ref_author_str}], Found: [{author_list}]"
-                        )
-                        result["matched_title"] = matched_title
-                        result["authors"] = author_list
-                        result["confidence"] = None
-                        if best_match.get("year"):
-                            result["year"] = best_match.get("year")
-                        results.append(result)
-                        success = True
-                        continue
-
-                    # Determine confidence based on scoring system
-                    if best_score >= 120:
-                        confidence = "high"
-                    elif best_score >= 90:
-                        confidence = "medium"
-                    elif best_score >= 70:
-                        confidence = "low"
-                    else:
-                        # Reject matches below score threshold
-                        result["error"] = (
-                            f"Match quality too low (score: {best_score:.1f}/160, overlap: {overlap:.1%}). "
-                            f"Expected: '{title[:80]}...', Found: '{matched_title[:80]}...'"
-                        )
-                        result["matched_title"] = matched_title
-                        result["confidence"] = None
-
-                        if authors:
-                            author_names = [a.get("name", "") for a in authors[:5]]
-                            result["authors"] = ", ".join(author_names)
-
-                        if best_match.get("year"):
-                            result["year"] = best_match.get("year")
-
-                        external_ids = best_match.get("externalIds", {})
-                        if external_ids and "DOI" in external_ids:
-                            result["doi"] = external_ids["DOI"]
-
-                        results.append(result)
-                        success = True
-                        continue
-
-                    result["exists"] = True
-                    result["matched_title"] = matched_title
-                    result["confidence"] = confidence
-
-                    # Extract DOI if available
-                    external_ids = best_match.get("externalIds", {})
-                    if external_ids and "DOI" in external_ids:
-                        result["doi"] = external_ids["DOI"]
-
-                    # Extract authors
-                    if authors:
-                        author_names = []
-                        for author in authors[:3]:
-                            author_names.append(author.get("name", ""))
-                        if len(authors) > 3:
-                            author_names.append("et al.")
-                        result["authors"] = ", ".join(author_names)
-
-                    # Get year from match if not provided
-                    if not result["year"]:
-                        result["year"] = best_match.get("year")
-
-                    results.append(result)
+                    # Defer scoring; the slot is filled once scored
+                    pending.append((idx - 1, ref, papers))
                     success = True
                     consecutive_429_errors = 0
 
@@ -571,18 +850,18 @@ class ReferenceChecker:
                             result["error"] = (
                                 f"Rate limit exceeded after {max_retries} retries"
                             )
-                            results.append(result)
+                            results[idx - 1] = result
                             success = True
                             if consecutive_429_errors > 3:
                                 time.sleep(30.0)
                     else:
                         result["error"] = f"Search failed: {error_msg}"
-                        results.append(result)
+                        results[idx - 1] = result
                         success = True
 
                 except Exception as e:
                     result["error"] = f"Unexpected error: {str(e)}"
-                    results.append(result)
+                    results[idx - 1] = result
                     success = True
 
             # Rate limiting delay between requests
@@ -592,35 +871,329 @@ class ReferenceChecker:
             pbar.update(1)
 
         pbar.close()
+
+        # Score all candidates, in worker processes for large batches
+        if pending:
+            positions, refs, papers_lists = zip(*pending)
+            if len(pending) > PROCESS_POOL_MIN_REFS:
+                with ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context(_POOL_START_METHOD)
+                ) as executor:
+                    scored = list(
+                        executor.map(
+                            _score_candidates, refs, papers_lists, chunksize=16
+                        )
+                    )
+            else:
+                scored = map(_score_candidates, refs, papers_lists)
+
+            for position, result in zip(positions, scored):
+                results[position] = result
+
         return results
 
-    def check_reference(self, reference: Dict[str, Optional[str]]) -> Dict:
+    def _check_doi_reference(
+        self,
+        reference: Dict[str, Optional[str]],
+        metadata: Optional[Dict] = None,
+        title_fallback: bool = True,
+    ) -> RefResult:
         """
-        Check a single reference (with DOI or title)
+        Check a reference by its DOI, falling back to a title search if the lookup fails
 
         Args:
             reference: Dictionary with reference information (doi, title, year, raw_text)
+            metadata: CrossRef metadata already fetched for this DOI, if any
+            title_fallback: Whether to run the title search fallback here
 
         Returns:
             Dictionary with check results
         """
-        # Try DOI first if available
+        result = self.check_doi(reference["doi"], metadata)
+        result["raw_text"] = reference.get("raw_text", "")
+        result["search_method"] = "doi"
+
+        # If DOI lookup failed and we have a title, try title search as fallback
+        if title_fallback and self._needs_title_fallback(reference, result):
+            result = self._check_title_fallback(reference)
+
+        return result
+
+    @staticmethod
+    def _needs_title_fallback(
+        reference: Dict[str, Optional[str]], result: Dict
+    ) -> bool:
+        """
+        Whether a DOI check result should be replaced by a title search
+
+        Args:
+            reference: Dictionary with reference information (doi, title, year)
+            result: Result of the DOI check
+
+        Returns:
+            True if the DOI lookup failed and the reference has a title
+        """
+        return bool(result.get("error") and reference.get("title"))
+
+    def _check_title_fallback(self, reference: Dict[str, Optional[str]]) -> RefResult:
+        """
+        Search by title for a reference whose DOI could not be resolved
+
+        Args:
+            reference: Dictionary with reference information (doi, title, year, raw_text)
+
+        Returns:
+            Dictionary with check results
+        """
+        result = self.check_by_title(reference["title"], reference.get("year"))
+        result["raw_text"] = reference.get("raw_text", "")
+        result["doi"] = reference.get("doi")  # Keep the invalid DOI for reference
+        result["search_method"] = "title (DOI fallback)"
+        return result
+
+    @classmethod
+    def _cache_key(cls, reference: Dict[str, Optional[str]]) -> tuple:
+        """
+        Build the result cache key for a reference
+
+        The key covers the same inputs as the in-run deduplication, so a
+        cached result is only reused where the lookup would be shared anyway.
+
+        Args:
+            reference: Dictionary with reference information (doi, title, year, raw_text)
+
+        Returns:
+            Cache key tuple
+        """
         if reference.get("doi"):
-            result = self.check_doi(reference["doi"])
-            result["raw_text"] = reference.get("raw_text", "")
-            result["search_method"] = "doi"
+            return ResultCache.make_key("doi", cls._doi_dedup_key(reference))
+        return ResultCache.make_key("title", cls._title_dedup_key(reference))
 
-            # If DOI lookup failed and we have a title, try title search as fallback
-            if result.get("error") and reference.get("title"):
-                result = self.check_by_title(reference["title"], reference.get("year"))
-                result["raw_text"] = reference.get("raw_text", "")
-                result["doi"] = reference.get(
-                    "doi"
-                )  # Keep the invalid DOI for reference
-                result["search_method"] = "title (DOI fallback)"
+    def _read_cache(
+        self, references: List[Dict[str, Optional[str]]]
+    ) -> List[Optional[Dict]]:
+        """
+        Look up references in the result cache
+
+        Args:
+            references: List of reference dictionaries
+
+        Returns:
+            Cached result per reference, or None where there is none
+        """
+        if not self._cache:
+            return [None] * len(references)
+        return [self._cache.get(self._cache_key(ref)) for ref in references]
+
+    @staticmethod
+    def _prefetch_key(doi_string: str) -> Optional[str]:
+        """
+        Get the key a DOI is prefetched under, if it can be prefetched
+
+        Args:
+            doi_string: DOI string from the reference
+
+        Returns:
+            Cleaned, lower-cased DOI, or None if it cannot go in a filter query
+        """
+        if not validate_doi(doi_string):
+            return None
+        doi = DOI(doi_string, validate=False).doi
+        # Commas separate filter terms, so such DOIs are looked up one by one
+        return None if "," in doi else doi.lower()
+
+    def _fetch_doi_chunk(self, dois: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch CrossRef metadata for one chunk of DOIs
+
+        Args:
+            dois: Cleaned DOIs
+
+        Returns:
+            Dictionary mapping lower-cased DOI to metadata; empty if the query fails
+        """
+        try:
+            return DOIQuery(session=self._session).get_works_by_doi(
+                dois, select=_CROSSREF_FIELDS, timeout=self.timeout
+            )
+        except DOIError:
+            # Every DOI in the chunk falls back to an individual lookup
+            return {}
+
+    async def _prefetch_dois(
+        self, references: List[Dict[str, Optional[str]]], sem: asyncio.Semaphore
+    ) -> Dict[str, Dict]:
+        """
+        Fetch CrossRef metadata for many DOIs using a few filter queries
 
+        Args:
+            references: References with DOIs that are not in the result cache
+            sem: Semaphore capping the number of requests in flight
+
+        Returns:
+            Dictionary mapping lower-cased DOI to CrossRef metadata
+        """
+        keys = [self._prefetch_key(ref["doi"]) for ref in references]
+        keys = list(dict.fromkeys(key for key in keys if key))
+
+        loop = asyncio.get_running_loop()
+
+        async def fetch(chunk: List[str]) -> Dict[str, Dict]:
+            async with sem:
+                return await loop.run_in_executor(None, self._fetch_doi_chunk, chunk)
+
+        prefetched: Dict[str, Dict] = {}
+        for found in await asyncio.gather(
+            *(
+                fetch(keys[i : i + DOI_PREFETCH_CHUNK])
+                for i in range(0, len(keys), DOI_PREFETCH_CHUNK)
+            )
+        ):
+            prefetched.update(found)
+        return prefetched
+
+    @staticmethod
+    def _doi_dedup_key(reference: Dict[str, Optional[str]]) -> tuple:
+        """
+        Key under which DOI references are considered the same lookup
+
+        The title and year are part of the key because they drive the title
+        search fallback when the DOI cannot be resolved.
+
+        Args:
+            reference: Dictionary with reference information (doi, title, year)
+
+        Returns:
+            Hashable key
+        """
+        return (
+            reference["doi"].strip().lower(),
+            reference.get("title"),
+            reference.get("year"),
+        )
+
+    @staticmethod
+    def _title_dedup_key(reference: Dict[str, Optional[str]]) -> tuple:
+        """
+        Key under which title references are considered the same search
+
+        The reference text is part of the key because the search query and
+        the author verification in scoring are both derived from it.
+
+        Args:
+            reference: Dictionary with reference information (title, year, raw_text)
+
+        Returns:
+            Hashable key
+        """
+        return (
+            _norm_title(reference["title"]),
+            reference.get("year"),
+            reference.get("raw_text", ""),
+        )
+
+    async def _lookup_doi(
+        self,
+        reference: Dict[str, Optional[str]],
+        sem: asyncio.Semaphore,
+        prefetched: Dict[str, Dict],
+        fallback_lock: asyncio.Lock,
+        cached: Optional[Dict] = None,
+    ) -> RefResult:
+        """
+        Check a DOI reference without blocking the event loop
+
+        Args:
+            reference: Dictionary with reference information (doi, title, year, raw_text)
+            sem: Semaphore capping the number of lookups in flight
+            prefetched: CrossRef metadata from _prefetch_dois()
+            fallback_lock: Lock running title search fallbacks one at a time
+            cached: Result for this reference from _read_cache(), if any
+
+        Returns:
+            Dictionary with check results
+        """
+        if cached is not None:
+            result = RefResult(**cached)
+            result["raw_text"] = reference.get("raw_text", "")
             return result
 
+        loop = asyncio.get_running_loop()
+        metadata = prefetched.get(self._prefetch_key(reference["doi"]))
+        if metadata is not None:
+            # No network access needed
+            result = self._check_doi_reference(reference, metadata, False)
+        else:
+            async with sem:
+                result = await loop.run_in_executor(
+                    None, self._check_doi_reference, reference, None, False
+                )
+
+        # The title search sleeps and blocks, so it never runs on the loop;
+        # fallbacks go one at a time since Semantic Scholar allows ~1 request/s
+        if self._needs_title_fallback(reference, result):
+            async with fallback_lock:
+                result = await loop.run_in_executor(
+                    None, self._check_title_fallback, reference
+                )
+
+        # Only verified results are cached; failures may be transient
+        if self._cache and result.get("exists"):
+            self._cache.set(self._cache_key(reference), result)
+        return result
+
+    async def _lookup_titles(
+        self, references_with_titles: List[Dict[str, Optional[str]]]
+    ) -> List[RefResult]:
+        """
+        Run the rate-limited batch title search without blocking the event loop
+
+        Args:
+            references_with_titles: List of reference dictionaries with titles
+
+        Returns:
+            List of check results in the same order as input
+        """
+        results: List[Optional[RefResult]] = [None] * len(references_with_titles)
+        misses = []
+
+        # Serve what we can from the cache; only misses go to the API
+        for i, cached in enumerate(self._read_cache(references_with_titles)):
+            if cached is not None:
+                results[i] = RefResult(**cached)
+            else:
+                misses.append(i)
+
+        if misses:
+            loop = asyncio.get_running_loop()
+            fetched = await loop.run_in_executor(
+                None,
+                self.check_by_title_batch,
+                [references_with_titles[i] for i in misses],
+            )
+            for i, result in zip(misses, fetched):
+                results[i] = result
+                if self._cache and result.get("exists"):
+                    self._cache.set(
+                        self._cache_key(references_with_titles[i]), result
+                    )
+
+        return results
+
+    def check_reference(self, reference: Dict[str, Optional[str]]) -> RefResult:
+        """
+        Check a single reference (with DOI or title)
+
+        Args:
+            reference: Dictionary with reference information (doi, title, year, raw_text)
+
+        Returns:
+            Dictionary with check results
+        """
+        # Try DOI first if available
+        if reference.get("doi"):
+            return self._check_doi_reference(reference)
+
         # Fall back to title search
         if reference.get("title"):
             result = self.check_by_title(reference["title"], reference.get("year"))
@@ -628,24 +1201,52 @@ class ReferenceChecker:
             return result
 
         # No DOI or title found
-        return {
-            "doi": None,
-            "title": None,
-            "search_method": None,
-            "valid_format": None,
-            "exists": False,
-            "authors": None,
-            "year": None,
-            "raw_text": reference.get("raw_text", ""),
-            "error": "No DOI or title found in reference",
-        }
+        return RefResult(
+            doi=None,
+            title=None,
+            search_method=None,
+            valid_format=None,
+            exists=False,
+            authors=None,
+            year=None,
+            raw_text=reference.get("raw_text", ""),
+            error="No DOI or title found in reference",
+        )
 
     def check_references(
         self, references: List[Dict[str, Optional[str]]], verbose: bool = True
-    ) -> List[Dict]:
+    ) -> List[RefResult]:
         """
         Check multiple references using batch processing for efficiency
 
+        DOI lookups run concurrently with each other and with the batch title
+        search. When called from inside a running event loop (e.g. Jupyter or
+        an async application), the check runs on its own loop in a worker
+        thread and this call blocks until it is done.
+
+        Args:
+            references: List of reference dictionaries to check
+            verbose: Print progress information
+
+        Returns:
+            List of dictionaries with check results
+        """
+        coro = self._check_references_async(references, verbose)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # asyncio.run() refuses to start inside a running loop
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, coro).result()
+
+    async def _check_references_async(
+        self, references: List[Dict[str, Optional[str]]], verbose: bool
+    ) -> List[RefResult]:
+        """
+        Check multiple references concurrently (see check_references)
+
         Args:
             references: List of reference dictionaries to check
             verbose: Print progress information
@@ -660,7 +1261,16 @@ class ReferenceChecker:
             print(f"Checking {len(references)} references...")
             print(f"{'='*70}\n")
 
-        # Separate references by type: DOI vs title-based
+        # Blocking requests calls run on a pool sized for this checker rather
+        # than the loop's default (which depends on the CPU count)
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        asyncio.get_running_loop().set_default_executor(executor)
+
+        # Create a results array with None placeholders
+        temp_results = [None] * len(references)
+
+        # Separate references by type: DOI vs title-based. References with
+        # neither need no lookup, so their error results are filled in here.
         doi_references = []
         title_references = []
         other_references = []
@@ -672,58 +1282,118 @@ class ReferenceChecker:
                 title_references.append((i, ref))
             else:
                 other_references.append((i, ref))
+                result = RefResult(
+                    doi=None,
+                    title=None,
+                    search_method=None,
+                    valid_format=None,
+                    exists=False,
+                    authors=None,
+                    year=None,
+                    raw_text=ref.get("raw_text", ""),
+                    error="No DOI or title found in reference",
+                )
+                temp_results[i] = result
 
-        # Create a results array with None placeholders
-        temp_results = [None] * len(references)
+        # Start all DOI lookups and the title batch at once; the semaphore
+        # keeps DOI requests within the API's rate limits
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        # A paper cited several times is only looked up once; the result is
+        # copied to every occurrence afterwards
+        title_firsts, title_positions = _dedupe(
+            [self._title_dedup_key(ref) for _, ref in title_references]
+        )
+        doi_firsts, doi_positions = _dedupe(
+            [self._doi_dedup_key(ref) for _, ref in doi_references]
+        )
+
+        title_task = None
+        if title_references:
+            # Extract just the references for batch processing
+            refs_for_batch = [title_references[i][1] for i in title_firsts]
+            title_task = asyncio.create_task(self._lookup_titles(refs_for_batch))
+
+        # Fetch DOI metadata in bulk first; only misses need their own request
+        unique_doi_refs = [doi_references[i][1] for i in doi_firsts]
+        doi_cached = self._read_cache(unique_doi_refs)
+        prefetched = await self._prefetch_dois(
+            [ref for ref, hit in zip(unique_doi_refs, doi_cached) if hit is None], sem
+        )
+        fallback_lock = asyncio.Lock()
+        doi_tasks = [
+            asyncio.create_task(
+                self._lookup_doi(reference, sem, prefetched, fallback_lock, hit)
+            )
+            for reference, hit in zip(unique_doi_refs, doi_cached)
+        ]
+
+        # Live progress while the DOI lookups complete (in any order)
+        pbar = tqdm(
+            total=len(doi_tasks),
+            desc="Checking DOIs",
+            unit="ref",
+            ncols=100,
+            disable=not verbose or not doi_tasks,
+        )
+        for task in doi_tasks:
+            task.add_done_callback(lambda _: pbar.update(1))
+        doi_results = _fan_out(
+            await asyncio.gather(*doi_tasks, return_exceptions=True), doi_positions
+        )
+        pbar.close()
+        batch_results = (
+            _fan_out(await title_task, title_positions) if title_task else []
+        )
 
         # Process DOI references individually
         if doi_references:
             if verbose:
                 print(f"Processing {len(doi_references)} references with DOIs...\n")
 
-            for idx, (original_idx, reference) in enumerate(doi_references, 1):
-                if verbose:
-                    display_text = reference.get("doi", "")
-                    print(f"[{idx}/{len(doi_references)}] Checking DOI: {display_text}")
-
-                result = self.check_doi(reference["doi"])
-                result["raw_text"] = reference.get("raw_text", "")
-                result["search_method"] = "doi"
-
-                # If DOI lookup failed and we have a title, try title search as fallback
-                if result.get("error") and reference.get("title"):
-                    result = self.check_by_title(
-                        reference["title"], reference.get("year")
+            for (original_idx, reference), result in zip(doi_references, doi_results):
+                if isinstance(result, Exception):
+                    result = RefResult(
+                        doi=reference["doi"],
+                        valid_format=False,
+                        exists=False,
+                        title=None,
+                        authors=None,
+                        year=None,
+                        error=f"Unexpected error: {str(result)}",
+                        raw_text=reference.get("raw_text", ""),
+                        search_method="doi",
                     )
-                    result["raw_text"] = reference.get("raw_text", "")
-                    result["doi"] = reference.get(
-                        "doi"
-                    )  # Keep the invalid DOI for reference
-                    result["search_method"] = "title (DOI fallback)"
 
+                # Shared results of duplicate lookups keep this reference's own text
+                result["doi"] = reference["doi"]
+                result["raw_text"] = reference.get("raw_text", "")
                 temp_results[original_idx] = result
 
                 if verbose:
+                    # Collect this reference's lines and write them at once
+                    display_text = reference.get("doi", "")
+                    lines = [f"Checking DOI: {display_text}"]
                     if result["exists"]:
                         search_method_display = (
                             " (DOI)"
                             if result["search_method"] == "doi"
                             else " (title fallback)"
                         )
-                        print(
+                        lines.append(
                             f"  ✓ VALID{search_method_display} - {result.get('title')}"
                         )
                         if result["authors"]:
-                            print(f"    Authors: {result['authors']}")
+                            lines.append(f"    Authors: {result['authors']}")
                         if result["year"]:
-                            print(f"    Year: {result['year']}")
+                            lines.append(f"    Year: {result['year']}")
                     else:
                         error_msg = result.get("error", "Unknown error")
                         if result.get("valid_format"):
-                            print(f"  ✗ NOT FOUND (DOI) - {error_msg}")
+                            lines.append(f"  ✗ NOT FOUND (DOI) - {error_msg}")
                         else:
-                            print(f"  ✗ INVALID DOI FORMAT - {error_msg}")
-                    print()
+                            lines.append(f"  ✗ INVALID DOI FORMAT - {error_msg}")
+                    print("\n".join(lines), end="\n\n")
 
         # Process title-based references in batch
         if title_references:
@@ -732,72 +1402,50 @@ class ReferenceChecker:
                     f"\nProcessing {len(title_references)} references by title (batch mode)...\n"
                 )
 
-            # Extract just the references for batch processing
-            refs_for_batch = [ref for _, ref in title_references]
-            batch_results = self.check_by_title_batch(refs_for_batch)
-
             # Map results back to original positions
             for (original_idx, reference), result in zip(
                 title_references, batch_results
             ):
+                result["title"] = reference["title"]
                 result["raw_text"] = reference.get("raw_text", "")
                 temp_results[original_idx] = result
 
                 if verbose:
-                    # Find position in title_references list
-                    title_idx = [
-                        i
-                        for i, (oi, _) in enumerate(title_references)
-                        if oi == original_idx
-                    ][0]
+                    # Collect this reference's lines and write them at once
                     display_text = reference.get("title", "")[:50]
-                    print(
-                        f"[{title_idx + 1}/{len(title_references)}] {display_text}..."
-                    )
+                    lines = [f"{display_text}..."]
 
                     if result["exists"]:
                         confidence = result.get("confidence", "unknown")
-                        print(
+                        lines.append(
                             f"  ✓ FOUND (title, {confidence} confidence) - {result.get('matched_title')}"
                         )
                         if result.get("doi"):
-                            print(f"    DOI: {result['doi']}")
+                            lines.append(f"    DOI: {result['doi']}")
                         if result["authors"]:
-                            print(f"    Authors: {result['authors']}")
+                            lines.append(f"    Authors: {result['authors']}")
                         if result["year"]:
-                            print(f"    Year: {result['year']}")
+                            lines.append(f"    Year: {result['year']}")
                     else:
                         error_msg = result.get("error", "Unknown error")
-                        print(f"  ✗ NOT FOUND (title search) - {error_msg}")
-                    print()
+                        lines.append(f"  ✗ NOT FOUND (title search) - {error_msg}")
+                    print("\n".join(lines), end="\n\n")
 
-        # Process other references (no DOI or title)
-        if other_references:
-            if verbose:
+        # Report other references (no DOI or title)
+        if other_references and verbose:
+            print(
+                f"\nProcessing {len(other_references)} references without DOI or title...\n"
+            )
+
+            for original_idx, _ in other_references:
                 print(
-                    f"\nProcessing {len(other_references)} references without DOI or title...\n"
+                    "No extractable information\n"
+                    f"  ✗ ERROR - {temp_results[original_idx]['error']}\n"
                 )
 
-            for idx, (original_idx, reference) in enumerate(other_references, 1):
-                result = {
-                    "doi": None,
-                    "title": None,
-                    "search_method": None,
-                    "valid_format": None,
-                    "exists": False,
-                    "authors": None,
-                    "year": None,
-                    "raw_text": reference.get("raw_text", ""),
-                    "error": "No DOI or title found in reference",
-                }
-                temp_results[original_idx] = result
-
-                if verbose:
-                    print(f"[{idx}/{len(other_references)}] No extractable information")
-                    print(f"  ✗ ERROR - {result['error']}\n")
-
-        # Compile final results in original order
-        self.results = [r for r in temp_results if r is not None]
+        # Every slot has been filled by one of the three branches above, so the
+        # placeholder list already holds the final results in original order
+        self.results = temp_results
 
         return self.results
 
@@ -809,15 +1457,17 @@ class ReferenceChecker:
             Dictionary with summary statistics
         """
         total = len(self.results)
-        # Count references by category (matching reporter.py logic)
-        exists = sum(1 for r in self.results if r.get("exists"))
-        has_error = sum(1 for r in self.results if r.get("error"))
-        not_found = sum(
-            1 for r in self.results if not r.get("exists") and not r.get("error")
-        )
 
-        # Legacy metrics (kept for backwards compatibility)
-        valid_format = sum(1 for r in self.results if r.get("valid_format"))
+        # Count references by category (matching reporter.py logic) in one pass
+        exists = has_error = not_found = valid_format = 0
+        for r in self.results:
+            found = bool(r.get("exists"))
+            failed = bool(r.get("error"))
+            exists += found
+            has_error += failed
+            not_found += not found and not failed
+            valid_format += bool(r.get("valid_format"))
+
         invalid_format = total - valid_format
 
         report = {
@@ -836,14 +1486,11 @@ class ReferenceChecker:
         """Print a formatted summary report"""
         report = self.generate_report()
 
-        print(f"\n{'='*70}")
-        print("REFERENCE CHECK SUMMARY")
-        print(f"{'='*70}")
-        print(f"Total references found:        {report['total_references']}")
-        print(f"Valid DOI format:              {report['valid_format']}")
-        print(f"Invalid DOI format:            {report['invalid_format']}")
-        print(f"References verified (exist):   {report['exists']}")
-        print(f"References not found:          {report['not_found']}")
-        print(f"References with errors:        {report['errors']}")
-        print(f"Success rate:                  {report['success_rate']:.1f}%")
-        print(f"{'='*70}\n")
+        sys.stdout.write(_REPORT_TMPL.format_map(report))
+
+    def close(self) -> None:
+        """Close the result cache and the HTTP session"""
+        if self._cache:
+            self._cache.close()
+            self._cache = None
+        self._session.close()
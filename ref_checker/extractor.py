@@ -4,9 +4,13 @@ Reference extraction from academic papers in PDF format.
 This module handles PDF text extraction and parsing of reference sections.
 """
 
+import os
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 try:
     import fitz  # PyMuPDF
@@ -15,6 +19,533 @@ except ImportError:
         "PyMuPDF is not installed. Please install it with: pip install PyMuPDF"
     )
 
+# Page text is only extracted in worker processes for documents with at least
+# this many pages; below it, process start-up costs more than it saves
+PROCESS_POOL_MIN_PAGES = 100
+
+# Plain-text extraction flags: the default set minus ligature and whitespace
+# preservation, which only cost layout work (downstream parsing normalizes
+# whitespace anyway). Dehyphenation is deliberately not enabled because it
+# would also drop hyphens from DOIs broken across lines.
+_TEXT_FLAGS = fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+
+# Static regex patterns are compiled once at import time instead of on every
+# call, since the parsing methods below run them per reference
+
+# Common reference section headers (matched case-insensitively), in priority
+# order: when several occur, the first occurrence of the earliest one wins
+_REF_HEADERS = ("references", "bibliography", "works cited", "literature")
+
+# One alternation over all headers. The trailing whitespace sits in a
+# lookahead so that a header directly following another is still found;
+# the "tail" group gives the end of the header line.
+_REF_HEADER_RE = re.compile(
+    r"\n(" + "|".join(_REF_HEADERS) + r")(?=(?P<tail>\s*\n))", re.IGNORECASE
+)
+
+# Sections that typically follow the references (e.g., appendix, acknowledgments)
+_REF_END_RES = [
+    re.compile(
+        r"\n(APPENDIX|Appendix|ACKNOWLEDGMENTS|Acknowledgments|ACKNOWLEDGEMENTS|Acknowledgements)\s*\n"
+    )
+]
+
+# DOI pattern for searching free text, with an optional doi:/doi.org prefix
+# (e.g., "doi: 10.xxxx/yyyy", "https://doi.org/10.xxxx/yyyy",
+# "http://dx.doi.org/10.xxxx/yyyy" or a bare "10.xxxx/yyyy"). The lookahead
+# keeps the matches zero-width, so a DOI that starts inside the greedy tail of
+# an earlier match is still found.
+_TEXT_DOI_RE = re.compile(
+    r"(?=(?P<prefix>https?://(?:dx\.)?doi\.org/|doi:\s*)?"
+    r"\b(?P<doi>10\.\d{4,}/[^\s\]]+))",
+    re.IGNORECASE,
+)
+_TEXT_DOI_TRAILING_RE = re.compile(r"[\.,;\)\]]+$")
+
+# Citation format detection and splitting
+_NUMBERED_REF_RE = re.compile(r"\n\s*(?:\[\d+\]|\(\d+\)|\d{1,3}\.)\s+[A-Z]")
+_AUTHORYEAR_REF_RE = re.compile(
+    r"\n[A-Z][a-z]+(?:\s+[a-z]+)*(?:-[A-Z][a-z]+)?,\s+[A-Z]\.(?:[A-Z]\.)*,\s+\d{4}\."
+)
+_AUTHORYEAR_SPLIT_RE = re.compile(
+    r"\n(?=[A-Z][a-z]+(?:\s+[a-z]+)*(?:-[A-Z][a-z]+)?,\s+[A-Z]\.)"
+)
+_NUMBERED_SPLIT_RE = re.compile(r"\n\s*(?:\[\d+\]|\(\d+\)|\d{1,3}\.)\s+")
+
+# Reference text cleanup
+# Translation table dropping invisible Unicode characters (zero-width spaces,
+# joiners, bidi marks, BOM, etc.) that PDFs insert and that break DOIs
+_INVISIBLE_DROP = dict.fromkeys(
+    [*range(0x200B, 0x2010), *range(0x2028, 0x2030), 0xFEFF], None
+)
+
+# Hyphenation at line breaks ("Sum- mary" → "Summary"), only between letters
+# so hyphens in DOIs and ISBNs (e.g., "978-3") are preserved
+_HYPHEN_RE = re.compile(r"([a-z])-\s+([a-z])", re.IGNORECASE)
+_JOURNAL_HEADER_RE = re.compile(
+    r"\b(?:Scientific Reports|Nature|Science|Cell|PNAS|Proceedings|Journal)[^\|]*\|\s*\(\d{4}\)\s*\d+[:\d\s]*\|\s*https?://[^\s]+",
+    re.IGNORECASE,
+)
+_HTTPS_FIX_RE = re.compile(r"https?\s*:\s*//", re.IGNORECASE)
+_DOI_URL_SPACE_RE = re.compile(r"(doi\.org/\S+?)\s+(\d+)", re.IGNORECASE)
+_DOI_RAW_SPACE_RE = re.compile(r"(10\.\d{4,}[./]\S+?)\s+(\d+)")
+_DOI_URL_SPACES_RE = re.compile(
+    r"(?:https?://)?doi\.org/10\.[^\s]{1,}(?:\s+[^\s]+)*", re.IGNORECASE
+)
+_YEAR_WORD_RE = re.compile(r"\b(19|20)\d{2}\b")
+_YEAR_OR_DOI_RE = re.compile(r"\b(?:19|20)\d{2}\b|doi\.org", re.IGNORECASE)
+
+# Conference header/footer contamination. Both patterns require a full month
+# name, so references without one can skip them entirely.
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+_CONTAMINATION_RES = [
+    # Pattern 1: "CONF 'YY, Month DD-DD, YYYY, Location AuthorNames..."
+    re.compile(
+        r"([A-Z]{2,6}\s+'?\d{2},?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}[–-]\d{1,2},?\s+\d{4},?\s+[A-Z][a-z]+,?\s+[A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+(?:,\s+[A-Z][a-z]+\s+[A-Z][a-z]+)+)"
+    ),
+    # Pattern 2: Similar but without date range
+    re.compile(
+        r"([A-Z]{2,6}\s+'?\d{2},?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4},?\s+[A-Z][a-z]+,?\s+[A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+(?:,\s+[A-Z][a-z]+\s+[A-Z][a-z]+)+)"
+    ),
+]
+_VENUE_START_RE = re.compile(r"^\s*(?:Symposium|Conference|Proceedings)", re.IGNORECASE)
+_DOI_ORG_RE = re.compile(r"https?://doi\.org", re.IGNORECASE)
+
+# Merged reference detection
+_DOI_URL_RE = re.compile(r"https?://doi\.org/(\S+)", re.IGNORECASE)
+_SENTENCE_AUTHOR_RE = re.compile(r"\.\s+([A-Z][a-z]+\s+[A-Z])")
+_VENUE_AUTHOR_RE = re.compile(
+    r"([A-Z][a-z]+(?:\s+\d+)?[,.]?\s+(?:December|January|February|March|April|May|June|July|August|September|October|November)?\s*\d{1,2}[–-]\d{1,2},?\s+\d{4},?\s+[A-Z][a-z]+,?\s+[A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+,\s+[A-Z][a-z]+\s+[A-Z][a-z]+)"
+)
+_DOI_PREFIX_RE = re.compile(r"doi:", re.IGNORECASE)
+_YEAR_DOI_AUTHOR_RE = re.compile(
+    r"(\b(19|20)\d{2}\b.*?(?:https?://doi\.org/\S+|doi:\s*\S+))\s+([A-Z][a-z]+\s+[A-Z][a-z]+.*?\b(19|20)\d{2}\b)",
+    re.IGNORECASE,
+)
+
+# Complete DOI extraction from a single reference: one alternation for all
+# DOI forms, ranked afterwards by _doi_match_rank(). The lookahead keeps the
+# matches zero-width so that overlapping candidates are all reported (e.g., a
+# doi.org/ match whose greedy tail runs into a later https://doi.org/ URL).
+_REF_DOI_RE = re.compile(
+    r"(?=(?P<prefix>https?://doi\.org/|doi\.org/|doi:\s*)(?P<doi>10\.[^\s]+)"
+    r"|\b(?P<raw>10\.\d{4,}(?:\.\d+)*\/[^\s]+))",
+    re.IGNORECASE,
+)
+
+# Title extraction, tried in this order by _extract_title_from_reference().
+# Quoted titles are the most reliable
+_TITLE_QUOTE_RES = (
+    re.compile(r'"([^"]+)"'),  # Double quotes
+    re.compile(r"'([^']+)'"),  # Single quotes
+)
+_EDITED_BOOK_RE = re.compile(r"\(Eds?\.\),\s+([^.]+?)\.", re.IGNORECASE)
+_YEAR_TITLE_RE = re.compile(
+    r"\b\d{4}\.\s+([^.]+[:.?!])\s+(?:[A-Z][a-z]*\.|\b(?:In|Proceedings|Journal))"
+)
+_TITLE_END_PUNCT_RE = re.compile(r"\s*[:.?!]\s*$")
+_DATASET_TITLE_RE = re.compile(
+    r"\b\d{4}\.\s+([^.]+?)\s*-\.\s*(?:dataset|report)", re.IGNORECASE
+)
+_BOOK_TITLE_RE = re.compile(r"([A-Z][^.(]+?)\s*\(([^)]+,\s+[^)]+,\s+\d{4})\)")
+_EDITOR_SUFFIX_RE = re.compile(r"\s+(eds?\.|ed\.|editors?|edited by)$", re.IGNORECASE)
+_BOOK_CHAPTER_RE = re.compile(r"\.\s+([A-Z][^.]+)\.\s+([A-Z][^.]+?)\s+\d+\s+\(\d{4}\)")
+_JOURNAL_ARTICLE_RE = re.compile(
+    r"([A-Z][^.]+)\.\s+([A-Z][^.]+?)\s+\d+,\s+\d+[–-]\d+\s+\(\d{4}\)"
+)
+_JOURNAL_TITLE_RE = re.compile(
+    r"^([^.]+\.)\s+([^.]+)\.\s+((?:IEEE|ACM|Proc\.|Proceedings|Journal|International|Conference|In\s+[A-Z]|[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})[^.]*,?\s+\d+.*\d{4}[.,]?\s*$)",
+    re.IGNORECASE,
+)
+_TRAILING_YEAR_RE = re.compile(r"\b(19|20)\d{2}$")
+
+# Fallback title heuristics
+# Venue prefixes stripped from title candidates (case-insensitive)
+_VENUE_PREFIXES = ("in ", "proceedings of ", "conference on ")
+_VENUE_KW_RE = re.compile(
+    r"(?:Proceedings|Conference|Journal|Symposium|Workshop|ACM|IEEE)\b", re.IGNORECASE
+)
+_CLEAN_PREFIX_RE = re.compile(r"^[.,;\s]+")
+_TITLE_TO_DOT_RE = re.compile(r"^([^.]+)")
+_CAPITALIZED_RE = re.compile(r"^[A-Z]")
+
+# Author list indicators for _looks_like_authors(), found in one scan: "and",
+# initials like "J." and "et al.". The three alternatives can never overlap, so
+# finditer() reports every occurrence. Trailing optional parts of the original
+# patterns (\s*[A-Z]?\.? after an initial, \.? after "al") are dropped as they
+# do not change whether a match exists.
+_AUTHOR_HINT_RE = re.compile(
+    r"(?P<conj>\b(?i:and)\b)|(?P<initial>\b[A-Z]\.)|(?P<etal>\b(?i:et\s+al)\b)"
+)
+_AUTHOR_HINT_WEIGHTS = {"conj": 1, "initial": 1, "etal": 2}
+
+# First author surname: "Surname, Initial" (group 1), else "Initial. Surname"
+# or "Surname" (group 2). The alternatives are tried in this order.
+_SURNAME_RE = re.compile(
+    r"^(?:([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]"
+    r"|(?:[A-Z]\.\s+)?([A-Z][a-z]+(?:-[A-Z][a-z]+)?))"
+)
+
+# Publication year (19xx or 20xx), the first one in the reference
+_YEARS_ALL_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+
+# Letters matched by [a-z] under re.IGNORECASE (ASCII plus four Unicode
+# characters that case-fold onto ASCII letters)
+_DOMAIN_LETTERS = frozenset(string.ascii_letters + "\u0130\u0131\u017f\u212a")
+# Maps those four characters to their ASCII letters, so that str.lower()
+# compares like re.IGNORECASE against lowercase ASCII text
+_ASCII_FOLD = str.maketrans("\u0130\u0131\u017f\u212a", "iisk")
+
+
+def _header_rank(match: re.Match) -> int:
+    """
+    Rank a _REF_HEADER_RE match by the priority of its header
+
+    Args:
+        match: Match of _REF_HEADER_RE
+
+    Returns:
+        Index of the header in _REF_HEADERS (0 is the preferred header)
+    """
+    return _REF_HEADERS.index(match.group(1).casefold())
+
+
+def _doi_match_rank(match: re.Match) -> int:
+    """
+    Rank a _REF_DOI_RE match by how reliably its form delimits a DOI
+
+    Args:
+        match: Match of _REF_DOI_RE
+
+    Returns:
+        0 for a https://doi.org/ URL, 1 for doi.org/, 2 for a doi: prefix and
+        3 for a raw DOI
+    """
+    prefix = match.group("prefix")
+    if prefix is None:
+        return 3
+    prefix = prefix.lower()
+    if prefix.startswith("http"):
+        return 0
+    if prefix.startswith("doi.org"):
+        return 1
+    return 2
+
+
+def _text_doi_rank(match: re.Match) -> int:
+    """
+    Rank a _TEXT_DOI_RE match by the form its DOI is written in
+
+    Args:
+        match: Match of _TEXT_DOI_RE
+
+    Returns:
+        0 for a doi: prefix, 1 for a doi.org URL, 2 for a dx.doi.org URL and
+        3 for a bare DOI
+    """
+    prefix = match.group("prefix")
+    if prefix is None:
+        return 3
+    prefix = prefix.lower()
+    if prefix.startswith("doi"):
+        return 0
+    return 2 if "dx." in prefix else 1
+
+
+def _default_num_workers() -> int:
+    """
+    Default number of worker processes for page extraction
+
+    Returns:
+        CPU count, at most 4
+    """
+    return min(os.cpu_count() or 1, 4)
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> str:
+    """
+    Extract the text of a range of pages.
+
+    Kept at module level so it can be pickled and mapped over a
+    ProcessPoolExecutor; each worker opens its own handle to the document.
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page
+        stop: Index one past the last page
+
+    Returns:
+        Concatenated text of the pages
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        return "".join(
+            doc[i].get_text("text", flags=_TEXT_FLAGS) for i in range(start, stop)
+        )
+    finally:
+        doc.close()
+
+
+def _letter_run_end(text: str, start: int) -> int:
+    """
+    Find the end of a run of domain letters
+
+    Args:
+        text: Text to scan
+        start: Index where the run starts
+
+    Returns:
+        Index one past the last letter of the run (start if there is none)
+    """
+    end = start
+    while end < len(text) and text[end] in _DOMAIN_LETTERS:
+        end += 1
+    return end
+
+
+def _is_domain_at(text: str, start: int) -> bool:
+    """
+    Check for "name.tld/" or "name.sub.tld/" at a position
+
+    Args:
+        text: Text to check
+        start: Index right after the leading period
+
+    Returns:
+        True if a domain followed by a slash starts at the position
+    """
+    end = _letter_run_end(text, start)
+    if end == start or not text.startswith(".", end):
+        return False
+    tld_start = end + 1
+    end = _letter_run_end(text, tld_start)
+    if end == tld_start:
+        return False
+    if text.startswith("/", end):
+        return True
+    if text.startswith(".", end):
+        sub_start = end + 1
+        end = _letter_run_end(text, sub_start)
+        return end > sub_start and text.startswith("/", end)
+    return False
+
+
+def _trim_doi(doi: str) -> str:
+    """
+    Strip invisible characters and trailing non-DOI content from a DOI
+
+    Each step cuts the DOI at the first position where a marker of trailing
+    content starts, scanning with str.find instead of a regex per step.
+
+    Args:
+        doi: DOI as captured from the reference text (no whitespace)
+
+    Returns:
+        Cleaned DOI string
+    """
+    # Remove invisible Unicode characters that PDFs sometimes insert
+    # This includes zero-width spaces (\u200b), zero-width joiners, etc.
+    doi = doi.translate(_INVISIBLE_DROP)
+
+    # Remove a year like "(1977)" or "(2020)" and anything after it, unless the
+    # next character is a digit or slash: parentheses can be part of the DOI
+    # itself, as in 10.1016/0031-9384(86)90050-8
+    pos = doi.find("(")
+    while pos != -1:
+        year = doi[pos + 1 : pos + 5]
+        if (
+            len(year) == 4
+            and year.isdecimal()
+            and doi.startswith(")", pos + 5)
+            and (pos + 6 == len(doi) or doi[pos + 6] not in "0123456789/")
+        ):
+            doi = doi[:pos]
+            break
+        pos = doi.find("(", pos + 1)
+
+    # Remove publisher text like "(AssociationforComputingMachinery...)",
+    # including nested parentheses like "(JohnWiley&SonsLtd(2016))": cut at
+    # the first "(" followed by a letter
+    pos = doi.find("(")
+    while pos != -1:
+        if pos + 1 < len(doi) and doi[pos + 1] in string.ascii_letters:
+            doi = doi[:pos]
+            break
+        pos = doi.find("(", pos + 1)
+
+    # Remove trailing URLs/domains that got attached (page headers/footers),
+    # e.g. ".www.nature.com/scientificreports/" or ".nature.com/..."
+    pos = doi.find(".")
+    while pos != -1:
+        start = pos + 1
+        if (
+            doi[start : start + 4].lower() == "www." and _is_domain_at(doi, start + 4)
+        ) or _is_domain_at(doi, start):
+            doi = doi[:pos]
+            break
+        pos = doi.find(".", start)
+
+    # Remove text after the DOI when it runs into the next reference or an
+    # article title: a period followed by a capital letter and a character
+    # that is not a digit or slash (".PrinciplesofNeuralScience", ".T.-S.",
+    # ".In:"), but not DOI parts like ".A123"
+    pos = doi.find(".")
+    while pos != -1:
+        if (
+            pos + 2 < len(doi)
+            and doi[pos + 1] in string.ascii_uppercase
+            and doi[pos + 2] not in "0123456789/"
+        ):
+            doi = doi[:pos]
+            break
+        pos = doi.find(".", pos + 1)
+
+    # Remove trailing periods and other punctuation
+    return doi.rstrip(".,;:/")
+
+
+def _split_sentences(ref_text: str) -> List[Tuple[str, int, int]]:
+    """
+    Split a reference into sentence-like parts at periods, keeping initials
+
+    A part ends at a period followed by whitespace or the end of the text,
+    unless the period follows a single capital letter (an initial like "A.").
+
+    Args:
+        ref_text: Reference text (normalized to single line)
+
+    Returns:
+        List of (stripped part, start, end) tuples; start and end are the
+        offsets of the unstripped part in ref_text
+    """
+    parts = []
+    current_pos = 0
+    text_len = len(ref_text)
+
+    period_pos = ref_text.find(".")
+    while period_pos != -1:
+        # Only a period followed by whitespace or the end of the text splits
+        split_end = period_pos + 1
+        while split_end < text_len and ref_text[split_end].isspace():
+            split_end += 1
+        if split_end == period_pos + 1 and split_end < text_len:
+            period_pos = ref_text.find(".", split_end)
+            continue
+
+        # Skip if it looks like an initial: a single capital letter at the
+        # start or after a space or comma (" A." or ", A." or "M. A.")
+        is_initial = (
+            period_pos > 0
+            and "A" <= ref_text[period_pos - 1] <= "Z"
+            and (
+                period_pos == 1
+                or ref_text[period_pos - 2].isspace()
+                or ref_text[period_pos - 2] == ","
+            )
+        )
+        if not is_initial:
+            part = ref_text[current_pos:period_pos].strip()
+            if part:
+                parts.append((part, current_pos, period_pos))
+            current_pos = split_end
+
+        period_pos = ref_text.find(".", split_end)
+
+    # Add remaining text if any
+    if current_pos < text_len:
+        part = ref_text[current_pos:].strip()
+        if part:
+            parts.append((part, current_pos, text_len))
+
+    return parts
+
+
+def _strip_venue_prefix(title: str) -> str:
+    """
+    Remove a leading "In ", "Proceedings of " or "Conference on " from a title
+
+    Args:
+        title: Title candidate
+
+    Returns:
+        Title without the venue prefix
+    """
+    head = title[:15].translate(_ASCII_FOLD).lower()
+    for prefix in _VENUE_PREFIXES:
+        if head.startswith(prefix):
+            return title[len(prefix) :]
+    return title
+
+
+@lru_cache(maxsize=8192)
+def _looks_like_authors(text: str) -> bool:
+    """
+    Check if text looks like author names
+
+    Cached because the title heuristics check the same candidate strings
+    several times per reference.
+
+    Args:
+        text: Text to check
+
+    Returns:
+        True if text likely contains author names
+    """
+    # Author indicators:
+    # - Contains "and" (connecting authors)
+    # - Contains initials (capital letters followed by period)
+    # - Contains comma-separated names
+    # - Relatively short (< 150 chars typically)
+
+    if len(text) > 200:
+        return False
+
+    # Multiple commas for author list
+    indicators = 1 if text.count(",") >= 2 else 0
+
+    # Each kind of indicator counts once; stop as soon as the threshold is met
+    seen = set()
+    for match in _AUTHOR_HINT_RE.finditer(text):
+        kind = match.lastgroup
+        if kind not in seen:
+            seen.add(kind)
+            indicators += _AUTHOR_HINT_WEIGHTS[kind]
+            if indicators >= 2:
+                return True
+
+    return False
+
+
+def _plausible_title(candidate: str) -> Optional[str]:
+    """
+    Turn a sentence of a reference into a title, if it looks like one
+
+    Args:
+        candidate: Sentence that may hold the title
+
+    Returns:
+        The candidate without a leading venue prefix ("In ", "Proceedings of ",
+        "Conference on ") if it is long enough and does not look like an
+        author list, else None
+    """
+    title = _strip_venue_prefix(candidate)
+    if len(title) > 15 and not _looks_like_authors(title):
+        return title
+    return None
+
 
 class ReferenceExtractor:
     """Extract references from academic papers in PDF format"""
@@ -30,23 +561,124 @@ class ReferenceExtractor:
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
-    def extract_text(self) -> str:
+        # Full text of the PDF, kept after the first extraction
+        self._text_cache: Optional[str] = None
+
+    def extract_text(self, num_workers: Optional[int] = None) -> str:
         """
         Extract all text from the PDF
 
+        The text is extracted once per instance; later calls (from any entry
+        point) return the cached text.
+
+        Args:
+            num_workers: Number of worker processes (default: CPU count, at most 4;
+                1 disables parallel extraction)
+
         Returns:
             Full text content of the PDF
         """
+        if self._text_cache is None:
+            self._text_cache = self._extract_text_impl(num_workers)
+        return self._text_cache
+
+    def _extract_text_impl(self, num_workers: Optional[int] = None) -> str:
+        """
+        Read the full text from the PDF file
+
+        Documents with at least PROCESS_POOL_MIN_PAGES pages are split into
+        page ranges that are extracted in parallel worker processes.
+
+        Args:
+            num_workers: Number of worker processes (default: CPU count, at most 4;
+                1 disables parallel extraction)
+
+        Returns:
+            Full text content of the PDF
+        """
+        if num_workers is None:
+            num_workers = _default_num_workers()
+
+        try:
+            doc = fitz.open(self.pdf_path)
+            page_count = doc.page_count
+
+            if num_workers > 1 and page_count >= PROCESS_POOL_MIN_PAGES:
+                doc.close()
+                # One contiguous page range per worker, joined back in page order
+                step = -(-page_count // num_workers)
+                starts = range(0, page_count, step)
+                stops = [min(start + step, page_count) for start in starts]
+                with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                    parts = executor.map(
+                        _extract_page_range,
+                        [str(self.pdf_path)] * len(stops),
+                        starts,
+                        stops,
+                    )
+                    return "".join(parts)
+
+            # Collect page texts and join once instead of growing a string
+            parts = []
+            for page in doc:
+                parts.append(page.get_text("text", flags=_TEXT_FLAGS))
+            doc.close()
+            return "".join(parts)
+        except Exception as e:
+            raise RuntimeError(f"Error reading PDF: {e}")
+
+    def extract_references_text(self) -> Optional[str]:
+        """
+        Extract the references section while reading the PDF page by page
+
+        Each page is scanned for section headers as it is read. Once a
+        top-priority ("References") header has been seen, the remaining pages
+        are only collected, not scanned. The full text is cached for later
+        extract_text() calls. Long documents that qualify for
+        parallel extraction are read with extract_text() instead.
+
+        Returns:
+            Text of the references section, or None if not found
+        """
         try:
             doc = fitz.open(self.pdf_path)
-            text = ""
+            if _default_num_workers() > 1 and doc.page_count >= PROCESS_POOL_MIN_PAGES:
+                doc.close()
+                return self.find_references_section(self.text)
+
+            parts = []
+            offset = 0  # Length of the text before the current page
+            carry = ""  # Unfinished last line of the scanned text
+            best = None  # (rank, position) of the best header found so far
             for page in doc:
-                text += page.get_text()
+                page_text = page.get_text("text", flags=_TEXT_FLAGS)
+                parts.append(page_text)
+
+                if best is None or best[0] > 0:
+                    # Rescan the last line of the previous pages so headers
+                    # split across a page break are found too
+                    chunk = carry + page_text
+                    chunk_start = offset - len(carry)
+                    for match in _REF_HEADER_RE.finditer(chunk):
+                        candidate = (_header_rank(match), chunk_start + match.start())
+                        if best is None or candidate < best:
+                            best = candidate
+                    carry = chunk[max(chunk.rfind("\n"), 0) :]
+
+                offset += len(page_text)
             doc.close()
-            return text
         except Exception as e:
             raise RuntimeError(f"Error reading PDF: {e}")
 
+        text = "".join(parts)
+        self._text_cache = text
+        if best is None:
+            return None
+
+        # Re-match on the full text, since the header's trailing blank lines
+        # may continue onto the next page
+        return self._section_after_header(text, _REF_HEADER_RE.match(text, best[1]))
+
     def find_references_section(self, text: str) -> Optional[str]:
         """
         Find and extract the references section from the paper text
@@ -57,35 +689,35 @@ class ReferenceExtractor:
         Returns:
             Text of the references section, or None if not found
         """
-        # Common reference section headers
-        patterns = [
-            r"\nREFERENCES\s*\n",
-            r"\nReferences\s*\n",
-            r"\nBIBLIOGRAPHY\s*\n",
-            r"\nBibliography\s*\n",
-            r"\nWorks Cited\s*\n",
-            r"\nLiterature\s*\n",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Extract everything after the references header
-                refs_start = match.end()
-                # Try to find end of references (e.g., appendix, acknowledgments)
-                end_patterns = [
-                    r"\n(APPENDIX|Appendix|ACKNOWLEDGMENTS|Acknowledgments|ACKNOWLEDGEMENTS|Acknowledgements)\s*\n"
-                ]
-                refs_end = len(text)
-                for end_pattern in end_patterns:
-                    end_match = re.search(end_pattern, text[refs_start:])
-                    if end_match:
-                        refs_end = refs_start + end_match.start()
-                        break
-
-                return text[refs_start:refs_end]
+        # Common reference section headers, all found in a single scan
+        match = min(_REF_HEADER_RE.finditer(text), key=_header_rank, default=None)
+        if not match:
+            return None
 
-        return None
+        return self._section_after_header(text, match)
+
+    def _section_after_header(self, text: str, header: re.Match) -> str:
+        """
+        Cut the references section that follows a section header
+
+        Args:
+            text: Full text of the paper
+            header: Match of _REF_HEADER_RE in text
+
+        Returns:
+            Text from the end of the header line up to the next section
+        """
+        # Extract everything after the references header
+        refs_start = header.end("tail")
+        # Try to find end of references (e.g., appendix, acknowledgments)
+        refs_end = len(text)
+        for end_pattern in _REF_END_RES:
+            end_match = end_pattern.search(text[refs_start:])
+            if end_match:
+                refs_end = refs_start + end_match.start()
+                break
+
+        return text[refs_start:refs_end]
 
     def extract_dois_from_text(self, text: str) -> List[str]:
         """
@@ -95,35 +727,28 @@ class ReferenceExtractor:
             text: Text to search for DOIs
 
         Returns:
-            List of DOI strings found
+            List of DOI strings found, grouped by form (doi:, doi.org,
+            dx.doi.org, bare) and in document order within each group
         """
-        # DOI patterns
-        doi_patterns = [
-            r"doi:\s*([^\s\]]+)",  # doi: 10.xxxx/yyyy
-            r"DOI:\s*([^\s\]]+)",  # DOI: 10.xxxx/yyyy
-            r"https?://doi\.org/([^\s\]]+)",  # https://doi.org/10.xxxx/yyyy
-            r"https?://dx\.doi\.org/([^\s\]]+)",  # http://dx.doi.org/10.xxxx/yyyy
-            r"\b(10\.\d{4,}/[^\s\]]+)",  # Direct DOI format
-        ]
+        # finditer rather than findall: the overlap check below needs match
+        # positions. sorted() is stable, so each form keeps its document order
+        matches = sorted(_TEXT_DOI_RE.finditer(text), key=_text_doi_rank)
 
         dois = []
-        for pattern in doi_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                doi = match.group(1)
-                # Clean up common trailing characters
-                doi = re.sub(r"[\.,;\)\]]+$", "", doi)
-                dois.append(doi)
+        form, form_end = None, 0
+        for match in matches:
+            rank = _text_doi_rank(match)
+            if rank != form:
+                form, form_end = rank, 0
+            # Like a separate scan per form, matches of one form never overlap
+            if match.start() < form_end:
+                continue
+            form_end = match.end("doi")
+            # Clean up common trailing characters
+            dois.append(_TEXT_DOI_TRAILING_RE.sub("", match.group("doi")))
 
         # Remove duplicates while preserving order
-        seen = set()
-        unique_dois = []
-        for doi in dois:
-            if doi not in seen:
-                seen.add(doi)
-                unique_dois.append(doi)
-
-        return unique_dois
+        return list(dict.fromkeys(dois))
 
     def parse_individual_references(
         self, refs_text: str
@@ -142,19 +767,12 @@ class ReferenceExtractor:
         # Detect citation format: numbered vs author-year
         # Check if we have numbered references like [1], (1), 1.
         # Must be followed by capital letter to be a real reference number (not a page number)
-        has_numbered_refs = bool(
-            re.search(r"\n\s*(?:\[\d+\]|\(\d+\)|\d{1,3}\.)\s+[A-Z]", refs_text)
-        )
+        has_numbered_refs = bool(_NUMBERED_REF_RE.search(refs_text))
 
         # Check if we have author-year format: "Lastname, I., Year." or "Lastname, I.I., Year."
         # Also matches multi-word names: "Van den Bogaert, L., Year."
         # Note: The pattern looks for comma BEFORE year, not period
-        has_authoryear_refs = bool(
-            re.search(
-                r"\n[A-Z][a-z]+(?:\s+[a-z]+)*(?:-[A-Z][a-z]+)?,\s+[A-Z]\.(?:[A-Z]\.)*,\s+\d{4}\.",
-                refs_text,
-            )
-        )
+        has_authoryear_refs = bool(_AUTHORYEAR_REF_RE.search(refs_text))
 
         if has_authoryear_refs and not has_numbered_refs:
             # Author-year format: split on "Lastname, Initial(s)..." at start of line
@@ -166,70 +784,60 @@ class ReferenceExtractor:
             #   (?:\s+[a-z]+)* - Zero or more lowercase words (den, de, la, etc.)
             #   (?:-[A-Z][a-z]+)? - Optional hyphenated part (for names like "Müller-Lyer")
             #   ,\s+[A-Z]\. - Comma + initial
-            pattern = r"\n(?=[A-Z][a-z]+(?:\s+[a-z]+)*(?:-[A-Z][a-z]+)?,\s+[A-Z]\.)"
-            parts = re.split(pattern, refs_text)
+            # Slice between the anchors found in one forward scan (dropping the
+            # newline itself), which yields the same parts as re.split
+            parts = []
+            part_start = 0
+            for anchor in _AUTHORYEAR_SPLIT_RE.finditer(refs_text):
+                parts.append(refs_text[part_start : anchor.start()])
+                part_start = anchor.end()
+            parts.append(refs_text[part_start:])
         else:
             # Numbered format: split by common reference numbering patterns
             # Matches: [1], [2], (1), (2), 1., 2., etc. at the start of a line
             # IMPORTANT: For plain numbers (e.g., "1."), only match 1-3 digits to avoid
             # matching years like "2021." which are 4 digits
-            pattern = r"\n\s*(?:\[\d+\]|\(\d+\)|\d{1,3}\.)\s+"
-            parts = re.split(pattern, refs_text)
+            parts = _NUMBERED_SPLIT_RE.split(refs_text)
 
         # Remove empty parts and join multi-line references
         ref_texts = []
         for part in parts:
             part = part.strip()
             if part:
-                # Fix hyphenation at line breaks (e.g., "Sum- mary" → "Summary")
-                # BUT preserve hyphens in DOIs and ISBNs (e.g., "978-3" should stay "978-3")
-                # Strategy: Only remove hyphen if it's between letters (word hyphenation)
-                # Keep hyphen if between digits or in patterns like "978-"
-                part = re.sub(r"([a-z])-\s+([a-z])", r"\1\2", part, flags=re.IGNORECASE)
+                # Fix hyphenation at line breaks (see _HYPHEN_RE)
+                part = _HYPHEN_RE.sub(r"\1\2", part)
 
                 # Clean up the reference text by normalizing whitespace
-                # Replace multiple spaces/newlines with single space
-                cleaned = re.sub(r"\s+", " ", part)
+                # Replace multiple spaces/newlines with single space (the part
+                # is already stripped, so split/join matches re.sub(r"\s+", " "))
+                cleaned = " ".join(part.split())
 
-                # Remove invisible Unicode characters (zero-width spaces, etc.) that PDFs insert
-                # These can appear anywhere and break DOI extraction
-                cleaned = re.sub(r"[\u200b-\u200f\u2028-\u202f\ufeff]", "", cleaned)
+                # Remove invisible Unicode characters (zero-width spaces, etc.) that
+                # PDFs insert. This runs after whitespace normalization so that
+                # line/paragraph separators in the same range become spaces.
+                cleaned = cleaned.translate(_INVISIBLE_DROP)
 
                 # Remove page headers/footers that get mixed into references
                 # Pattern: "Scientific Reports | (2025) 15:10297 7 | https://doi.org/..."
                 # These typically have: JournalName | (YEAR) Volume:Page | URL
-                cleaned = re.sub(
-                    r"\b(?:Scientific Reports|Nature|Science|Cell|PNAS|Proceedings|Journal)[^\|]*\|\s*\(\d{4}\)\s*\d+[:\d\s]*\|\s*https?://[^\s]+",
-                    "",
-                    cleaned,
-                    flags=re.IGNORECASE,
-                )
+                cleaned = _JOURNAL_HEADER_RE.sub("", cleaned)
 
                 # Fix DOIs split by spaces or invisible characters
                 # 1. "https: //doi.org" → "https://doi.org"
-                cleaned = re.sub(
-                    r"https?\s*:\s*//", "https://", cleaned, flags=re.IGNORECASE
-                )
+                cleaned = _HTTPS_FIX_RE.sub("https://", cleaned)
                 # 2. "doi.org/10.1234/ 5678" → "doi.org/10.1234/5678"
-                cleaned = re.sub(
-                    r"(doi\.org/\S+?)\s+(\d+)", r"\1\2", cleaned, flags=re.IGNORECASE
-                )
+                cleaned = _DOI_URL_SPACE_RE.sub(r"\1\2", cleaned)
                 # 3. "10.1109/VR.2019. 8797975" → "10.1109/VR.2019.8797975"
-                cleaned = re.sub(r"(10\.\d{4,}[./]\S+?)\s+(\d+)", r"\1\2", cleaned)
+                cleaned = _DOI_RAW_SPACE_RE.sub(r"\1\2", cleaned)
 
                 # 4. More aggressive: Remove ALL spaces within DOI strings
                 # Pattern: "doi.org/10. 1234 / 5678" → "doi.org/10.1234/5678"
                 def clean_doi_spaces(match):
                     doi_full = match.group(0)
                     # Remove all spaces from the DOI portion
-                    return re.sub(r"\s+", "", doi_full)
+                    return "".join(doi_full.split())
 
-                cleaned = re.sub(
-                    r"(?:https?://)?doi\.org/10\.[^\s]{1,}(?:\s+[^\s]+)*",
-                    clean_doi_spaces,
-                    cleaned,
-                    flags=re.IGNORECASE,
-                )
+                cleaned = _DOI_URL_SPACES_RE.sub(clean_doi_spaces, cleaned)
 
                 # Remove conference header/footer contamination
                 # Pattern: "Conference Year, Date range, Location AuthorNames"
@@ -245,19 +853,19 @@ class ReferenceExtractor:
                 continue
 
             # Skip if it's just author names (no year or DOI)
-            if (
-                not re.search(r"\b(19|20)\d{2}\b", ref_text)
-                and "doi.org" not in ref_text.lower()
-            ):
+            if not _YEAR_OR_DOI_RE.search(ref_text):
                 continue
 
             # Check if this reference might contain multiple merged references
             # Indicators: multiple DOIs, or multiple year patterns with author patterns between them
             split_refs = self._split_merged_references(ref_text)
 
-            for split_ref in split_refs:
+            for split_ref, doi_hint in split_refs:
                 # Extract DOI if present - look for complete DOI
-                doi = self._extract_complete_doi(split_ref)
+                if doi_hint is not None:
+                    doi = doi_hint
+                else:
+                    doi = self._extract_complete_doi(split_ref)
 
                 # Extract title (usually in quotes or italics, or between author and publication info)
                 title = self._extract_title_from_reference(split_ref)
@@ -289,15 +897,12 @@ class ReferenceExtractor:
         # date range, location, then author names (which shouldn't be there)
         # E.g., "VRST '21, December 8–10, 2021, Osaka, Japan Tor-Salve Dalsgaard, Jarrod Knibbe"
 
-        contamination_patterns = [
-            # Pattern 1: "CONF 'YY, Month DD-DD, YYYY, Location AuthorNames..."
-            r"([A-Z]{2,6}\s+'?\d{2},?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}[–-]\d{1,2},?\s+\d{4},?\s+[A-Z][a-z]+,?\s+[A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+(?:,\s+[A-Z][a-z]+\s+[A-Z][a-z]+)+)",
-            # Pattern 2: Similar but without date range
-            r"([A-Z]{2,6}\s+'?\d{2},?\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4},?\s+[A-Z][a-z]+,?\s+[A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+(?:,\s+[A-Z][a-z]+\s+[A-Z][a-z]+)+)",
-        ]
+        # Cheap probe first: the contamination patterns all contain a month name
+        if not any(month in ref_text for month in _MONTHS):
+            return ref_text
 
-        for pattern in contamination_patterns:
-            match = re.search(pattern, ref_text)
+        for pattern in _CONTAMINATION_RES:
+            match = pattern.search(ref_text)
             if match:
                 # Remove the author names part (group 2) but keep the venue/date info
                 # Actually, let's remove the entire contaminated section if it appears after a journal/proceedings
@@ -312,14 +917,8 @@ class ReferenceExtractor:
 
                 # If there's a DOI soon after, or if we're near the end, remove the entire match
                 if (
-                    re.search(
-                        r"^\s*(?:Symposium|Conference|Proceedings)",
-                        after_contamination,
-                        re.IGNORECASE,
-                    )
-                    or re.search(
-                        r"https?://doi\.org", after_contamination, re.IGNORECASE
-                    )
+                    _VENUE_START_RE.search(after_contamination)
+                    or _DOI_ORG_RE.search(after_contamination)
                     or len(after_contamination) < 50
                 ):
                     # Remove the contamination
@@ -327,7 +926,9 @@ class ReferenceExtractor:
 
         return ref_text
 
-    def _split_merged_references(self, ref_text: str) -> List[str]:
+    def _split_merged_references(
+        self, ref_text: str
+    ) -> List[Tuple[str, Optional[str]]]:
         """
         Detect and split references that have been merged together
 
@@ -335,7 +936,9 @@ class ReferenceExtractor:
             ref_text: Reference text that might contain multiple merged references
 
         Returns:
-            List of individual reference texts (single item if not merged)
+            List of (reference text, DOI hint) tuples (single item if not merged).
+            The hint is the reference's cleaned DOI when the DOI scan done here
+            already determines it, otherwise None.
         """
         # Strategy: Look for patterns that indicate a new reference starting mid-text
         # Common indicators:
@@ -344,9 +947,7 @@ class ReferenceExtractor:
         #    where we have two different years with author names between them
 
         # Check for multiple DOIs
-        doi_matches = list(
-            re.finditer(r"https?://doi\.org/\S+", ref_text, re.IGNORECASE)
-        )
+        doi_matches = list(_DOI_URL_RE.finditer(ref_text))
         if len(doi_matches) > 1:
             # Split at the start of the second DOI, working backwards to find logical split point
             second_doi_pos = doi_matches[1].start()
@@ -357,9 +958,7 @@ class ReferenceExtractor:
 
             # Try to find where the new reference starts (look for ". " followed by capitalized word)
             # This usually indicates end of previous reference and start of new author list
-            potential_splits = list(
-                re.finditer(r"\.\s+([A-Z][a-z]+\s+[A-Z])", before_second_doi)
-            )
+            potential_splits = list(_SENTENCE_AUTHOR_RE.finditer(before_second_doi))
 
             if potential_splits:
                 # Take the last occurrence before the second DOI
@@ -368,8 +967,8 @@ class ReferenceExtractor:
                 ref2 = ref_text[split_point:].strip()
 
                 # Extract years from both parts
-                year1_match = re.search(r"\b(19|20)\d{2}\b", ref1)
-                year2_match = re.search(r"\b(19|20)\d{2}\b", ref2)
+                year1_match = _YEAR_WORD_RE.search(ref1)
+                year2_match = _YEAR_WORD_RE.search(ref2)
 
                 # Validate both parts have years AND different years
                 # IMPORTANT: If both years are the same, this is likely ONE reference with duplicate DOI
@@ -379,21 +978,19 @@ class ReferenceExtractor:
                     and year2_match
                     and year1_match.group(0) != year2_match.group(0)
                 ):
-                    return [ref1, ref2]
+                    return [(ref1, None), (ref2, None)]
 
         # Check for DOI followed by text that looks like a new reference
         # Pattern: "...https://doi.org/XXXXX Title/Conference Year Author Names"
         # Look for: DOI, then later there's "Author1, Author2" or "Author1 Author2. Year"
-        doi_match = re.search(r"https?://doi\.org/\S+", ref_text, re.IGNORECASE)
+        doi_match = doi_matches[0] if doi_matches else None
         if doi_match:
             after_doi = ref_text[doi_match.end() :]
 
             # Look for pattern: venue/journal/conference name followed by author-like text
             # E.g., "VRST '21, December 8–10, 2021, Osaka, Japan Tor-Salve Dalsgaard, Jarrod Knibbe"
             # Pattern: Location/Date, then FirstName LastName, FirstName LastName
-            venue_author_pattern = r"([A-Z][a-z]+(?:\s+\d+)?[,.]?\s+(?:December|January|February|March|April|May|June|July|August|September|October|November)?\s*\d{1,2}[–-]\d{1,2},?\s+\d{4},?\s+[A-Z][a-z]+,?\s+[A-Z][a-z]+)\s+([A-Z][a-z]+(?:-[A-Z][a-z]+)?\s+[A-Z][a-z]+,\s+[A-Z][a-z]+\s+[A-Z][a-z]+)"
-
-            match = re.search(venue_author_pattern, after_doi)
+            match = _VENUE_AUTHOR_RE.search(after_doi)
             if match:
                 # Split after the venue/location part, before author names
                 split_pos = doi_match.end() + match.start(2)
@@ -401,12 +998,20 @@ class ReferenceExtractor:
                 ref2 = ref_text[split_pos:].strip()
 
                 if len(ref1) > 30 and len(ref2) > 30:
-                    return [ref1, ref2]
+                    return [(ref1, None), (ref2, None)]
 
         # Check for pattern: year and page numbers, followed by author names and another year
         # Example: "Journal (2008), 43–46. https://doi.org/... FirstName LastName. 2021."
-        pattern = r"(\b(19|20)\d{2}\b.*?(?:https?://doi\.org/\S+|doi:\s*\S+))\s+([A-Z][a-z]+\s+[A-Z][a-z]+.*?\b(19|20)\d{2}\b)"
-        match = re.search(pattern, ref_text, re.IGNORECASE)
+        # The pattern backtracks heavily, so first check what it needs: a DOI
+        # (URL or "doi:" prefix) and two years
+        match = None
+        first_year = _YEAR_WORD_RE.search(ref_text)
+        if (
+            (doi_matches or _DOI_PREFIX_RE.search(ref_text))
+            and first_year
+            and _YEAR_WORD_RE.search(ref_text, first_year.end())
+        ):
+            match = _YEAR_DOI_AUTHOR_RE.search(ref_text)
 
         if match:
             # Find the split point between the DOI/first year and the new author names
@@ -421,8 +1026,8 @@ class ReferenceExtractor:
                 ref2 = ref_text[last_period + 1 :].strip()
 
                 # Extract years from both parts
-                year1_match = re.search(r"\b(19|20)\d{2}\b", ref1)
-                year2_match = re.search(r"\b(19|20)\d{2}\b", ref2)
+                year1_match = _YEAR_WORD_RE.search(ref1)
+                year2_match = _YEAR_WORD_RE.search(ref2)
 
                 # Validate both parts
                 # IMPORTANT: If both years are the same, this is likely ONE reference
@@ -434,10 +1039,15 @@ class ReferenceExtractor:
                     and year2_match
                     and year1_match.group(0) != year2_match.group(0)  # Different years
                 ):
-                    return [ref1, ref2]
+                    return [(ref1, None), (ref2, None)]
 
-        # No merge detected, return as single reference
-        return [ref_text]
+        # No merge detected, return as single reference. If the first DOI URL
+        # holds a DOI, that is the one _extract_complete_doi() would pick, so
+        # pass it along instead of scanning the reference again.
+        doi_hint = None
+        if doi_matches and doi_matches[0].group(1).startswith("10."):
+            doi_hint = _trim_doi(doi_matches[0].group(1))
+        return [(ref_text, doi_hint)]
 
     def _extract_complete_doi(self, ref_text: str) -> Optional[str]:
         """
@@ -450,74 +1060,24 @@ class ReferenceExtractor:
             Complete DOI string or None
         """
         # Pattern for DOI - capture everything after doi.org/ or doi:
-        # More permissive pattern to capture complete DOI
-        doi_patterns = [
-            r"https?://doi\.org/(10\.[^\s]+)",  # URL format
-            r"doi\.org/(10\.[^\s]+)",  # Without http
-            r"doi:\s*(10\.[^\s]+)",  # doi: prefix
-            r"\b(10\.\d{4,}(?:\.\d+)*\/[^\s]+)",  # Raw DOI format
-        ]
-
-        for pattern in doi_patterns:
-            match = re.search(pattern, ref_text, re.IGNORECASE)
-            if match:
-                doi = match.group(1)
-
-                # Remove all whitespace characters (including zero-width spaces, invisible chars)
-                # DOIs should never contain spaces
-                doi = re.sub(r"\s+", "", doi)
-
-                # Remove invisible Unicode characters that PDFs sometimes insert
-                # This includes zero-width spaces (\u200b), zero-width joiners, etc.
-                doi = re.sub(r"[\u200b-\u200f\u2028-\u202f\ufeff]", "", doi)
-
-                # Clean up trailing content that's not part of DOI:
-                # - Year in parentheses at END: (1977), (2020) - but NOT parentheses within DOI like 10.1016/0031-9384(86)90050-8
-                # - Publisher text after DOI: (AssociationforComputingMachinery...)
-                # - Trailing URLs like ".www.nature.com/scientificreports/"
-                # Strategy: Remove trailing parenthetical that contains only digits (year) or text (publisher)
-                # but keep parentheses that are part of the DOI structure
-
-                # First, remove trailing year like "(1977)" or "(2020)" and anything after it
-                # Pattern: (YEAR) followed by anything that's not part of DOI (not digit/slash)
-                doi = re.sub(r"\((\d{4})\)(?:[^0-9/].*)?$", "", doi)
-
-                # Then remove trailing publisher text like "(AssociationforComputingMachinery...)"
-                # This handles nested parentheses like "(JohnWiley&SonsLtd(2016))"
-                # Remove everything from first "(" followed by a letter to the end
-                doi = re.sub(r"\([A-Za-z].*$", "", doi)
-
-                # Remove trailing URLs/domains that got attached (page headers/footers)
-                # Pattern: ".www.domain.com..." or ".nature.com..." etc
-                doi = re.sub(
-                    r"\.(?:www\.)?[a-z]+\.[a-z]+(?:\.[a-z]+)?/.*$",
-                    "",
-                    doi,
-                    flags=re.IGNORECASE,
-                )
+        # More permissive pattern to capture complete DOI. All forms are matched
+        # in one scan; the first match of the most reliable form wins
+        # (https://doi.org/ URL, then doi.org/, then doi: prefix, then raw DOI)
+        match = min(_REF_DOI_RE.finditer(ref_text), key=_doi_match_rank, default=None)
+        if not match:
+            return None
 
-                # Remove text after DOI when it continues into next reference or article title
-                # Patterns that indicate we've gone past the DOI:
-                # 1. ".PrinciplesofNeuralScience" - period + capitalized title
-                # 2. ".T.-S.Dalsgaard" - period + author name pattern (including initials)
-                # 3. ".In:" - period + common continuation word
-                # Strategy: Remove period + capital letter + anything after it
-                # BUT: Don't match if followed immediately by a digit (part of DOI like ".A123")
-                doi = re.sub(r"\.([A-Z][^0-9/]).*$", "", doi)
-                # Re-add the period if we removed it (was part of ending punctuation, not continuation)
-                if doi and not doi.endswith((".", "/")):
-                    # Check if original had more content - if last char is letter, don't add period
-                    pass
+        doi = match.group("doi") or match.group("raw")
 
-                # Clean up any trailing punctuation that's not part of DOI
-                doi = re.sub(r"[,;.\s]+$", "", doi)
+        # Remove all whitespace characters (including zero-width spaces, invisible chars)
+        # DOIs should never contain spaces
+        doi = "".join(doi.split())
 
-                # Remove trailing periods and other punctuation
-                doi = doi.rstrip(".,;:/")
+        # Remove invisible Unicode characters and trailing content that is not
+        # part of the DOI (years, publisher names, page headers, next reference)
+        doi = _trim_doi(doi)
 
-                return doi
-
-        return None
+        return doi
 
     def _extract_title_from_reference(self, ref_text: str) -> Optional[str]:
         """
@@ -530,15 +1090,8 @@ class ReferenceExtractor:
             Extracted title or None
         """
         # Try to extract title in quotes first (most reliable)
-        quote_patterns = [
-            r'"([^"]+)"',  # Double quotes
-            r"'([^']+)'",  # Single quotes
-            r'"([^"]+)"',  # Smart quotes
-            r"'([^']+)'",  # Smart single quotes
-        ]
-
-        for pattern in quote_patterns:
-            match = re.search(pattern, ref_text)
+        for pattern in _TITLE_QUOTE_RES:
+            match = pattern.search(ref_text)
             if match:
                 title = match.group(1).strip()
                 if len(title) > 10:
@@ -546,9 +1099,7 @@ class ReferenceExtractor:
 
         # EDITED BOOK PATTERN: "Authors (Eds.), Title. Publisher..."
         # Example: "Wiertlewski, M., Smeets, J. (Eds.), Haptics: Science, Technology, Applications. Springer..."
-        edited_book_match = re.search(
-            r"\(Eds?\.\),\s+([^.]+?)\.", ref_text, re.IGNORECASE
-        )
+        edited_book_match = _EDITED_BOOK_RE.search(ref_text)
         if edited_book_match:
             title = edited_book_match.group(1).strip()
             if len(title) > 10:
@@ -558,22 +1109,17 @@ class ReferenceExtractor:
         # Handles titles ending with colon, question mark, or exclamation
         # Example: "Sharpe, D., 2019. Chi-square test is statistically significant: now what? Pract..."
         # This pattern captures title that ends with punctuation before an abbreviated word
-        year_title_match = re.search(
-            r"\b\d{4}\.\s+([^.]+[:.?!])\s+(?:[A-Z][a-z]*\.|\b(?:In|Proceedings|Journal))",
-            ref_text,
-        )
+        year_title_match = _YEAR_TITLE_RE.search(ref_text)
         if year_title_match:
             title = year_title_match.group(1).strip()
             # Remove trailing punctuation if it's just the marker
-            title = re.sub(r"\s*[:.?!]\s*$", "", title)
+            title = _TITLE_END_PUNCT_RE.sub("", title)
             if len(title) > 10:
                 return title
 
         # DATASET/REPORT PATTERN: "Authors, Year. Title -. dataset/report."
         # Example: "Dalsgaard, T.-S., ..., 2022. A user-derived mapping for mid-air haptic experiences -. dataset."
-        dataset_match = re.search(
-            r"\b\d{4}\.\s+([^.]+?)\s*-\.\s*(?:dataset|report)", ref_text, re.IGNORECASE
-        )
+        dataset_match = _DATASET_TITLE_RE.search(ref_text)
         if dataset_match:
             title = dataset_match.group(1).strip()
             if len(title) > 10:
@@ -583,24 +1129,18 @@ class ReferenceExtractor:
         # Examples:
         # - "Chemesthesis: Chemical Touch in Food and Eating (John Wiley & Sons, Inc, Chichester, West Sussex, 2016), 1. edn."
         # - "Principles of Neural Science (McGraw-Hill, New York, 2021), 6th edn."
-        book_match = re.search(
-            r"([A-Z][^.(]+?)\s*\(([^)]+,\s+[^)]+,\s+\d{4})\)", ref_text
-        )
+        book_match = _BOOK_TITLE_RE.search(ref_text)
         if book_match:
             title = book_match.group(1).strip()
             # Clean up trailing connectors and editor notes
-            title = re.sub(
-                r"\s+(eds?\.|ed\.|editors?|edited by)$", "", title, flags=re.IGNORECASE
-            )
-            if len(title) > 10 and not self._looks_like_authors(title):
+            title = _EDITOR_SUFFIX_RE.sub("", title)
+            if len(title) > 10 and not _looks_like_authors(title):
                 return title
 
         # BOOK CHAPTER PATTERN: "Authors. ChapterTitle. BookTitle pages (Year)."
         # Example: "Sawka, M. N., ... Physiological responses to exercise in the heat. Nutritional needs in hot environments: applications for military personnel in field operations 55 (1993)."
         # Pattern: Two sentences before "NUMBER (YEAR)"
-        book_chapter_match = re.search(
-            r"\.\s+([A-Z][^.]+)\.\s+([A-Z][^.]+?)\s+\d+\s+\(\d{4}\)", ref_text
-        )
+        book_chapter_match = _BOOK_CHAPTER_RE.search(ref_text)
         if book_chapter_match:
             title1 = book_chapter_match.group(1).strip()
             title2 = book_chapter_match.group(2).strip()
@@ -609,7 +1149,7 @@ class ReferenceExtractor:
             if (
                 ":" not in title1
                 and len(title1) > 20
-                and not self._looks_like_authors(title1)
+                and not _looks_like_authors(title1)
             ):
                 return title1
 
@@ -618,9 +1158,7 @@ class ReferenceExtractor:
         # - "Hirayama, R., ... S. A volumetric display for visual, tactile and audio presentation using acoustic trapping. Nature 575, 320–323 (2019)."
         # - "Wood, S. N. Fast stable restricted maximum likelihood... Journal of the Royal Statistical Society (B) 73, 3–36 (2011)."
         # Pattern: Sentence ending with "JournalName Number, Number-Number (Year)"
-        journal_article_match = re.search(
-            r"([A-Z][^.]+)\.\s+([A-Z][^.]+?)\s+\d+,\s+\d+[–-]\d+\s+\(\d{4}\)", ref_text
-        )
+        journal_article_match = _JOURNAL_ARTICLE_RE.search(ref_text)
         if journal_article_match:
             potential_title = journal_article_match.group(1).strip()
             journal_name = journal_article_match.group(2).strip()
@@ -628,7 +1166,7 @@ class ReferenceExtractor:
             # Check if potential_title doesn't look like authors and journal_name looks like a journal
             if (
                 len(potential_title) > 20
-                and not self._looks_like_authors(potential_title)
+                and not _looks_like_authors(potential_title)
                 and len(journal_name.split()) <= 8
             ):  # Journal names are usually short
                 return potential_title
@@ -636,16 +1174,13 @@ class ReferenceExtractor:
         # JOURNAL ARTICLE PATTERN 2: Handle "Authors. Title. Journal, volume:pages, year." pattern
         # Pattern: Text ends with journal-like string followed by volume/pages and year
         # Example: "M. Hassenzahl. Engineering joy. IEEE Software, 18(1):70–76, 2001."
-        journal_pattern = r"^([^.]+\.)\s+([^.]+)\.\s+((?:IEEE|ACM|Proc\.|Proceedings|Journal|International|Conference|In\s+[A-Z]|[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,3})[^.]*,?\s+\d+.*\d{4}[.,]?\s*$)"
-        journal_match = re.match(journal_pattern, ref_text, re.IGNORECASE)
+        journal_match = _JOURNAL_TITLE_RE.match(ref_text)
         if journal_match:
             potential_title = journal_match.group(2).strip()
             # Verify it's not author names and has reasonable length
-            if len(potential_title) > 10 and not self._looks_like_authors(
-                potential_title
-            ):
+            if len(potential_title) > 10 and not _looks_like_authors(potential_title):
                 # Extra check: shouldn't end with year (that would be part 1, not title)
-                if not re.search(r"\b(19|20)\d{2}$", potential_title):
+                if not _TRAILING_YEAR_RE.search(potential_title):
                     return potential_title
 
         # Common citation formats:
@@ -655,7 +1190,7 @@ class ReferenceExtractor:
         # 4. Authors. Title. Journal, volume:pages, year. (handled above)
 
         # Try to find year position
-        year_match = re.search(r"\b(19|20)\d{2}\b", ref_text)
+        year_match = _YEAR_WORD_RE.search(ref_text)
         if not year_match:
             return None
 
@@ -665,36 +1200,7 @@ class ReferenceExtractor:
         # Split reference into parts using periods as delimiters
         # but keep track of positions
         # IMPORTANT: Don't split on periods that are part of initials (e.g., "A. Jorge")
-        parts = []
-        current_pos = 0
-
-        # More intelligent period detection: skip periods in initials
-        # Pattern: period not preceded by a single capital letter (initial)
-        # We want to split on: ". " where the char before . is NOT: "single capital letter"
-        for match in re.finditer(r"\.(?:\s+|$)", ref_text):
-            period_pos = match.start()
-
-            # Check if this is an initial: single capital letter before period
-            # Look at the character(s) before the period
-            if period_pos > 0:
-                # Check the word before the period
-                # If it's a single capital letter (possibly preceded by space), it's an initial
-                before_period = ref_text[max(0, period_pos - 3) : period_pos]
-
-                # Skip if it looks like an initial: " A." or ", A." or "M. A."
-                if re.search(r"(?:^|[\s,])([A-Z])$", before_period):
-                    continue
-
-            part = ref_text[current_pos : match.start()].strip()
-            if part:
-                parts.append((part, current_pos, match.start()))
-            current_pos = match.end()
-
-        # Add remaining text if any
-        if current_pos < len(ref_text):
-            part = ref_text[current_pos:].strip()
-            if part:
-                parts.append((part, current_pos, len(ref_text)))
+        parts = _split_sentences(ref_text)
 
         if len(parts) < 2:
             return None
@@ -712,15 +1218,8 @@ class ReferenceExtractor:
         # Strategy 1: If year is in first part (e.g., "Authors 2020"), title is likely second part
         if year_part_idx == 0:
             if len(parts) > 1:
-                title = parts[1][0]
-                # Remove common prefixes
-                title = re.sub(
-                    r"^(In |Proceedings of |Conference on )",
-                    "",
-                    title,
-                    flags=re.IGNORECASE,
-                )
-                if len(title) > 15 and not self._looks_like_authors(title):
+                title = _plausible_title(parts[1][0])
+                if title:
                     return title
 
         # Strategy 2: If year is in second part or later, title is likely the part before year
@@ -728,7 +1227,7 @@ class ReferenceExtractor:
         elif year_part_idx > 0:
             # Check if first part is just authors (short, has "and", has initials)
             first_part = parts[0][0]
-            if self._looks_like_authors(first_part) and len(parts) > 1:
+            if _looks_like_authors(first_part) and len(parts) > 1:
                 # Title is likely second part (before or after year)
                 if year_part_idx == 1:
                     # Year in second part: could be "Authors. 2020 Title. Conference" or "Authors. 2020. Title. Conference"
@@ -738,79 +1237,36 @@ class ReferenceExtractor:
                     if year_part_text.strip() == year_val:
                         # Year is alone in this part, title is likely next part
                         if len(parts) > 2:
-                            title = parts[2][0]
-                            # Clean up common prefixes
-                            title = re.sub(
-                                r"^(In |Proceedings of |Conference on )",
-                                "",
-                                title,
-                                flags=re.IGNORECASE,
-                            )
-                            if len(title) > 15 and not self._looks_like_authors(title):
+                            title = _plausible_title(parts[2][0])
+                            if title:
                                 return title
                     else:
                         # Year has text after it in same part: "Authors. 2020 Title. Conference"
                         # Extract text after year in same part
                         year_end = year_pos - parts[1][1] + 4  # Position within part
                         title_text = parts[1][0][year_end:].strip()
-                        title_text = re.sub(r"^[.,;\s]+", "", title_text)
+                        title_text = _CLEAN_PREFIX_RE.sub("", title_text)
                         if len(title_text) > 15:
                             # Take until next sentence indicator
-                            title_match = re.match(r"^([^.]+)", title_text)
+                            title_match = _TITLE_TO_DOT_RE.match(title_text)
                             if title_match:
                                 return title_match.group(1).strip()
                 else:
                     # Year in later part, title is second part
                     title = parts[1][0]
-                    if len(title) > 15 and not self._looks_like_authors(title):
+                    if len(title) > 15 and not _looks_like_authors(title):
                         return title
 
         # Fallback: look for capitalized title-like text between author names and venue
         # Pattern: look for text that starts with capital letter and contains multiple words
         for part, start, end in parts[1:]:  # Skip first part (likely authors)
-            if len(part) > 20 and re.match(r"^[A-Z]", part):
+            if len(part) > 20 and _CAPITALIZED_RE.match(part):
                 # Check if it's not a venue/journal (usually has keywords like "Proceedings", "Conference", "Journal")
-                if not re.search(
-                    r"(?:Proceedings|Conference|Journal|Symposium|Workshop|ACM|IEEE)\b",
-                    part,
-                    re.IGNORECASE,
-                ):
+                if not _VENUE_KW_RE.search(part):
                     return part
 
         return None
 
-    def _looks_like_authors(self, text: str) -> bool:
-        """
-        Check if text looks like author names
-
-        Args:
-            text: Text to check
-
-        Returns:
-            True if text likely contains author names
-        """
-        # Author indicators:
-        # - Contains "and" (connecting authors)
-        # - Contains initials (capital letters followed by period)
-        # - Contains comma-separated names
-        # - Relatively short (< 150 chars typically)
-
-        if len(text) > 200:
-            return False
-
-        indicators = 0
-
-        if re.search(r"\band\b", text, re.IGNORECASE):
-            indicators += 1
-        if re.search(r"\b[A-Z]\.\s*[A-Z]?\.?", text):  # Initials like "J. M." or "J."
-            indicators += 1
-        if text.count(",") >= 2:  # Multiple commas for author list
-            indicators += 1
-        if re.search(r"\bet\s+al\.?\b", text, re.IGNORECASE):  # "et al."
-            indicators += 2
-
-        return indicators >= 2
-
     def _extract_first_author_surname(self, ref_text: str) -> Optional[str]:
         """
         Extract first author's surname from reference text
@@ -824,15 +1280,11 @@ class ReferenceExtractor:
         # Pattern: "Surname, Initial" or "Initial. Surname" at start
         # Examples: "M. Hassenzahl", "Hassenzahl, M.", "Hassenzahl"
 
-        # Try "Surname, Initial" format first
-        match = re.match(r"^([A-Z][a-z]+(?:-[A-Z][a-z]+)?),\s*[A-Z]", ref_text)
-        if match:
-            return match.group(1)
-
-        # Try "Initial. Surname" or just "Surname"
-        match = re.match(r"^(?:[A-Z]\.\s+)?([A-Z][a-z]+(?:-[A-Z][a-z]+)?)", ref_text)
+        # "Surname, Initial" format is tried first, then "Initial. Surname"
+        # or just "Surname"
+        match = _SURNAME_RE.match(ref_text)
         if match:
-            return match.group(1)
+            return match.group(1) or match.group(2)
 
         return None
 
@@ -846,31 +1298,54 @@ class ReferenceExtractor:
         Returns:
             Publication year or None
         """
-        # Look for 4-digit year (19xx or 20xx)
-        matches = re.findall(r"\b(19\d{2}|20\d{2})\b", ref_text)
-        if matches:
-            return int(matches[0])
+        # Look for the first 4-digit year (19xx or 20xx)
+        match = _YEARS_ALL_RE.search(ref_text)
+        if match:
+            return int(match.group(1))
         return None
 
+    @property
+    def text(self) -> str:
+        """Full text of the PDF, extracted on first access"""
+        return self.extract_text()
+
+    @cached_property
+    def references_section(self) -> Optional[str]:
+        """References section text (None if not found), located on first access"""
+        if self._text_cache is not None:
+            return self.find_references_section(self._text_cache)
+        return self.extract_references_text()
+
+    @cached_property
+    def parsed_references(self) -> List[Dict[str, Optional[str]]]:
+        """Parsed entries of the references section, parsed on first access"""
+        refs_section = self.references_section
+        if not refs_section:
+            return []
+        return self.parse_individual_references(refs_section)
+
     def extract_references(self) -> List[Dict[str, Optional[str]]]:
         """
         Extract all references from the PDF
 
+        The PDF text, the references section and its parsed entries are cached
+        on the instance, so calling this again does not re-read the PDF.
+
         Returns:
             List of dictionaries containing reference information (doi, title, year, raw_text)
         """
-        text = self.extract_text()
-        refs_section = self.find_references_section(text)
+        refs_section = self.references_section
 
         if refs_section:
             print(f"✓ Found references section ({len(refs_section)} characters)")
-            references = self.parse_individual_references(refs_section)
+            # Copies, so callers can modify them without touching the cache
+            references = [dict(ref) for ref in self.parsed_references]
         else:
             print(
                 "⚠ Warning: Could not identify references section, searching entire document for DOIs"
             )
             # Fallback: just extract DOIs
-            dois = self.extract_dois_from_text(text)
+            dois = self.extract_dois_from_text(self.text)
             references = [
                 {"raw_text": doi, "doi": doi, "title": None, "year": None}
                 for doi in dois
@@ -5,8 +5,57 @@ This module handles JSON and Markdown report generation,
 grouping references by verification status and confidence level.
 """
 
+import io
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+# orjson is optional; it writes large JSON reports noticeably faster than json
+try:
+    import orjson
+
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+# Heading for references without any title
+_UNKNOWN_TITLE = "Unknown Title"
+
+# Markdown boilerplate around each reference's collapsible details
+_DETAILS_OPEN = "<details>\n<summary>Show details</summary>\n\n"
+_DETAILS_CLOSE = "</details>\n\n"
+
+# Human-readable search methods; any other method is a title search
+_SEARCH_METHOD_LABELS = {"doi": "DOI lookup", "doi_batch": "DOI lookup"}
+
+# Reference fields rendered as "**Label**: value" lines, as
+# (key, label, value template) in display order
+_DOI_LINK = "[{0}](https://doi.org/{0})"
+_ORIGINAL_FIELDS = (
+    ("title", "Title", "{}"),
+    ("authors", "Authors", "{}"),
+    ("year", "Year", "{}"),
+    ("doi", "DOI", _DOI_LINK),
+    ("publisher", "Publisher", "{}"),
+    ("journal", "Journal", "{}"),
+    ("volume", "Volume", "{}"),
+    ("pages", "Pages", "{}"),
+)
+_FOUND_FIELDS = (
+    ("matched_title", "Title", "{}"),
+    ("matched_authors", "Authors", "{}"),
+    ("matched_year", "Year", "{}"),
+    ("matched_doi", "DOI", _DOI_LINK),
+    ("matched_venue", "Venue", "{}"),
+    ("matched_citation_count", "Citations", "{}"),
+    ("matched_influential_citation_count", "Influential Citations", "{}"),
+)
+# Partial matches of failed checks only show the core fields
+_PARTIAL_MATCH_FIELDS = _FOUND_FIELDS[:4]
+_MATCHED_KEYS = tuple(key for key, _, _ in _PARTIAL_MATCH_FIELDS)
+_SIMILARITY_FIELDS = (
+    ("title_similarity", "Title Similarity", "{:.1%}"),
+    ("author_overlap", "Author Overlap", "{:.1%}"),
+)
 
 
 class ReportGenerator:
@@ -32,7 +81,7 @@ class ReportGenerator:
         Returns:
             Title string, or "Unknown Title" if none found
         """
-        return ref.get("matched_title") or ref.get("title", "Unknown Title")
+        return ref.get("matched_title") or ref.get("title") or _UNKNOWN_TITLE
 
     @staticmethod
     def _get_search_method(ref: Dict) -> Optional[str]:
@@ -45,262 +94,235 @@ class ReportGenerator:
         Returns:
             Search method string or None
         """
-        if ref.get("search_method"):
-            return (
-                "DOI lookup"
-                if ref["search_method"] in ["doi", "doi_batch"]
-                else "Title search"
-            )
-        return None
+        search_method = ref.get("search_method")
+        if not search_method:
+            return None
+        return _SEARCH_METHOD_LABELS.get(search_method, "Title search")
 
     @staticmethod
-    def _render_original_reference(ref: Dict) -> List[str]:
+    def _render_fields(ref: Dict, fields: Tuple, buf: io.StringIO) -> None:
         """
-        Render the original parsed reference section
+        Render the set fields of a reference as "**Label**: value" lines
 
         Args:
             ref: Reference dictionary
+            fields: Field table of (key, label, value template) tuples
+            buf: Buffer the markdown lines are written to
+        """
+        for key, label, template in fields:
+            value = ref.get(key)
+            if value:
+                buf.write(f"**{label}**: {template.format(value)}  \n")
 
-        Returns:
-            List of markdown lines
+    @staticmethod
+    def _render_original_reference(ref: Dict, buf: io.StringIO) -> None:
         """
-        lines = []
-        lines.append("##### Original Reference (Parsed from PDF)\n")
+        Render the original parsed reference section
+
+        Args:
+            ref: Reference dictionary
+            buf: Buffer the markdown lines are written to
+        """
+        buf.write("##### Original Reference (Parsed from PDF)\n\n")
 
         if ref.get("raw_text"):
-            lines.append(f"**Parsed Reference**: `{ref['raw_text']}`\n")
-        if ref.get("title"):
-            lines.append(f"**Title**: {ref['title']}  ")
-        if ref.get("authors"):
-            lines.append(f"**Authors**: {ref['authors']}  ")
-        if ref.get("year"):
-            lines.append(f"**Year**: {ref['year']}  ")
-        if ref.get("doi"):
-            lines.append(f"**DOI**: [{ref['doi']}](https://doi.org/{ref['doi']})  ")
-        if ref.get("publisher"):
-            lines.append(f"**Publisher**: {ref['publisher']}  ")
-        if ref.get("journal"):
-            lines.append(f"**Journal**: {ref['journal']}  ")
-        if ref.get("volume"):
-            lines.append(f"**Volume**: {ref['volume']}  ")
-        if ref.get("pages"):
-            lines.append(f"**Pages**: {ref['pages']}  ")
-
-        return lines
+            buf.write(f"**Parsed Reference**: `{ref['raw_text']}`\n\n")
+        ReportGenerator._render_fields(ref, _ORIGINAL_FIELDS, buf)
 
     @staticmethod
-    def _render_found_reference(ref: Dict) -> List[str]:
+    def _render_found_reference(ref: Dict, buf: io.StringIO) -> None:
         """
         Render the found/matched reference section from academic database
 
         Args:
             ref: Reference dictionary
-
-        Returns:
-            List of markdown lines
-        """
-        lines = []
-        lines.append("\n##### Found Reference (From Academic Database)\n")
-
-        if ref.get("matched_title"):
-            lines.append(f"**Title**: {ref['matched_title']}  ")
-        if ref.get("matched_authors"):
-            lines.append(f"**Authors**: {ref['matched_authors']}  ")
-        if ref.get("matched_year"):
-            lines.append(f"**Year**: {ref['matched_year']}  ")
-        if ref.get("matched_doi"):
-            lines.append(
-                f"**DOI**: [{ref['matched_doi']}](https://doi.org/{ref['matched_doi']})  "
-            )
-        if ref.get("matched_venue"):
-            lines.append(f"**Venue**: {ref['matched_venue']}  ")
-        if ref.get("matched_citation_count"):
-            lines.append(f"**Citations**: {ref['matched_citation_count']}  ")
-        if ref.get("matched_influential_citation_count"):
-            lines.append(
-                f"**Influential Citations**: {ref['matched_influential_citation_count']}  "
-            )
-
-        return lines
+            buf: Buffer the markdown lines are written to
+        """
+        buf.write("\n##### Found Reference (From Academic Database)\n\n")
+        ReportGenerator._render_fields(ref, _FOUND_FIELDS, buf)
 
     @staticmethod
-    def _render_verification_details(ref: Dict) -> List[str]:
+    def _render_verification_details(ref: Dict, buf: io.StringIO) -> None:
         """
         Render verification details section
 
         Args:
             ref: Reference dictionary
-
-        Returns:
-            List of markdown lines
+            buf: Buffer the markdown lines are written to
         """
-        lines = []
-        lines.append("\n##### Verification Details\n")
+        buf.write("\n##### Verification Details\n\n")
 
         method = ReportGenerator._get_search_method(ref)
         if method:
-            lines.append(f"**Search Method**: {method}  ")
+            buf.write(f"**Search Method**: {method}  \n")
         if ref.get("confidence"):
-            lines.append(f"**Confidence Level**: {ref['confidence'].title()}  ")
-        if ref.get("title_similarity"):
-            lines.append(f"**Title Similarity**: {ref['title_similarity']:.1%}  ")
-        if ref.get("author_overlap"):
-            lines.append(f"**Author Overlap**: {ref['author_overlap']:.1%}  ")
+            buf.write(f"**Confidence Level**: {ref['confidence'].title()}  \n")
+        ReportGenerator._render_fields(ref, _SIMILARITY_FIELDS, buf)
         if ref.get("year_match") is not None:
-            lines.append(f"**Year Match**: {'✓' if ref['year_match'] else '✗'}  ")
-
-        return lines
+            buf.write(f"**Year Match**: {'✓' if ref['year_match'] else '✗'}  \n")
 
     @staticmethod
-    def _render_verified_reference(ref: Dict, index: int) -> List[str]:
+    def _render_verified_reference(ref: Dict, index: int, buf: io.StringIO) -> None:
         """
         Render a complete verified reference with collapsible details
 
         Args:
             ref: Reference dictionary
             index: Reference number
-
-        Returns:
-            List of markdown lines
+            buf: Buffer the markdown lines are written to
         """
-        lines = []
         title = ReportGenerator._get_reference_title(ref)
-        lines.append(f"#### **{index}. {title}**")
+        buf.write(f"#### **{index}. {title}**\n")
 
         # Collapsible details section (collapsed by default)
-        lines.append("<details>")
-        lines.append("<summary>Show details</summary>\n")
+        buf.write(_DETAILS_OPEN)
 
         # Add all sections
-        lines.extend(ReportGenerator._render_original_reference(ref))
-        lines.extend(ReportGenerator._render_found_reference(ref))
-        lines.extend(ReportGenerator._render_verification_details(ref))
+        ReportGenerator._render_original_reference(ref, buf)
+        ReportGenerator._render_found_reference(ref, buf)
+        ReportGenerator._render_verification_details(ref, buf)
 
-        lines.append("</details>\n")
-        return lines
+        buf.write(_DETAILS_CLOSE)
 
     @staticmethod
-    def _render_not_found_reference(ref: Dict, index: int) -> List[str]:
+    def _render_not_found_reference(ref: Dict, index: int, buf: io.StringIO) -> None:
         """
         Render a not-found reference with collapsible details
 
         Args:
             ref: Reference dictionary
             index: Reference number
-
-        Returns:
-            List of markdown lines
+            buf: Buffer the markdown lines are written to
         """
-        lines = []
-        title = ref.get("title") or "Unknown Title"
-        lines.append(f"#### **{index}. {title}**")
+        title = ref.get("title") or _UNKNOWN_TITLE
+        buf.write(f"#### **{index}. {title}**\n")
 
         # Collapsible details section (collapsed by default)
-        lines.append("<details>")
-        lines.append("<summary>Show details</summary>\n")
+        buf.write(_DETAILS_OPEN)
 
-        lines.extend(ReportGenerator._render_original_reference(ref))
+        ReportGenerator._render_original_reference(ref, buf)
 
         # Search details
-        lines.append("\n### Search Details\n")
+        buf.write("\n### Search Details\n\n")
         method = ReportGenerator._get_search_method(ref)
         if method:
-            lines.append(f"**Search Method**: {method}  ")
-        lines.append("**Status**: Not found in academic databases  ")
+            buf.write(f"**Search Method**: {method}  \n")
+        buf.write("**Status**: Not found in academic databases  \n")
 
-        lines.append("</details>\n")
-        return lines
+        buf.write(_DETAILS_CLOSE)
 
     @staticmethod
-    def _render_error_reference(ref: Dict, index: int) -> List[str]:
+    def _render_error_reference(ref: Dict, index: int, buf: io.StringIO) -> None:
         """
         Render an error reference with collapsible details
 
         Args:
             ref: Reference dictionary
             index: Reference number
-
-        Returns:
-            List of markdown lines
+            buf: Buffer the markdown lines are written to
         """
-        lines = []
-        title = ref.get("title") or ref.get("matched_title") or "Unknown Title"
-        lines.append(f"#### **{index}. {title}**")
+        title = ref.get("title") or ref.get("matched_title") or _UNKNOWN_TITLE
+        buf.write(f"#### **{index}. {title}**\n")
 
         # Collapsible details section (collapsed by default)
-        lines.append("<details>")
-        lines.append("<summary>Show details</summary>\n")
+        buf.write(_DETAILS_OPEN)
 
         # Error information
         if ref.get("error"):
-            lines.append(f"##### Error\n**{ref['error']}**\n")
+            buf.write(f"##### Error\n**{ref['error']}**\n\n")
 
-        lines.extend(ReportGenerator._render_original_reference(ref))
+        ReportGenerator._render_original_reference(ref, buf)
 
         # Found reference information (if any partial match)
-        if any(
-            ref.get(k)
-            for k in ["matched_title", "matched_authors", "matched_year", "matched_doi"]
-        ):
-            lines.append("\n##### Partial Match Found\n")
-            if ref.get("matched_title"):
-                lines.append(f"**Title**: {ref['matched_title']}  ")
-            if ref.get("matched_authors"):
-                lines.append(f"**Authors**: {ref['matched_authors']}  ")
-            if ref.get("matched_year"):
-                lines.append(f"**Year**: {ref['matched_year']}  ")
-            if ref.get("matched_doi"):
-                lines.append(
-                    f"**DOI**: [{ref['matched_doi']}](https://doi.org/{ref['matched_doi']})  "
-                )
-
-        lines.append("</details>\n")
-        return lines
+        if any(ref.get(key) for key in _MATCHED_KEYS):
+            buf.write("\n##### Partial Match Found\n\n")
+            ReportGenerator._render_fields(ref, _PARTIAL_MATCH_FIELDS, buf)
+
+        buf.write(_DETAILS_CLOSE)
 
     @staticmethod
-    def _render_unparsed_reference(ref: Dict, index: int) -> List[str]:
+    def _render_unparsed_reference(ref: Dict, index: int, buf: io.StringIO) -> None:
         """
         Render an unparsed reference with collapsible details
 
         Args:
             ref: Reference dictionary
             index: Reference number
-
-        Returns:
-            List of markdown lines
+            buf: Buffer the markdown lines are written to
         """
-        lines = []
-        lines.append(f"#### **{index}. Unable to Parse Reference**")
+        buf.write(f"#### **{index}. Unable to Parse Reference**\n")
 
         # Collapsible details section (collapsed by default)
-        lines.append("<details>")
-        lines.append("<summary>Show details</summary>\n")
+        buf.write(_DETAILS_OPEN)
 
-        lines.append("##### Parsing Failed\n")
-        lines.append("Could not extract DOI or title from this reference.\n")
+        buf.write("##### Parsing Failed\n\n")
+        buf.write("Could not extract DOI or title from this reference.\n\n")
 
         if ref.get("raw_text"):
-            lines.append(f"\n**Parsed reference**: `{ref['raw_text']}`")
+            buf.write(f"\n**Parsed reference**: `{ref['raw_text']}`\n")
         else:
-            lines.append("\n*No text available*")
+            buf.write("\n*No text available*\n")
 
-        lines.append("\n</details>\n")
-        return lines
+        buf.write("\n")
+        buf.write(_DETAILS_CLOSE)
 
-    def generate_summary(self) -> Dict:
+    def _categorize_and_count(self) -> Tuple[Dict, Dict[str, List[Dict]]]:
         """
-        Generate a summary report of the checking results
+        Compute the summary statistics and group references by category
+
+        Both are built in a single pass over the results.
 
         Returns:
-            Dictionary with summary statistics
+            Tuple of (summary dictionary, category name -> list of references).
+            The categories are verified_high, verified_medium, verified_low,
+            not_found, errors and no_doi_or_title.
         """
+        categories = {
+            "verified_high": [],
+            "verified_medium": [],
+            "verified_low": [],
+            "not_found": [],
+            "errors": [],
+            "no_doi_or_title": [],
+        }
+        verified_high = categories["verified_high"]
+        not_found_refs = categories["not_found"]
+        errors = categories["errors"]
+        no_doi_or_title = categories["no_doi_or_title"]
+        # Verified references by confidence level; DOI-based verification has
+        # no confidence level and counts as high confidence
+        by_confidence = {
+            "high": verified_high,
+            "medium": categories["verified_medium"],
+            "low": categories["verified_low"],
+        }
+
+        valid_format = 0
+        exists = 0
+        for ref in self.results:
+            if ref.get("valid_format"):
+                valid_format += 1
+            ref_exists = ref.get("exists")
+            if ref_exists:
+                exists += 1
+
+            error = ref.get("error")
+            if error:
+                if "No DOI or title" in error:
+                    no_doi_or_title.append(ref)
+                else:
+                    errors.append(ref)
+            elif ref_exists:
+                confidence = ref.get("confidence", "").lower()
+                by_confidence.get(confidence, verified_high).append(ref)
+            else:
+                not_found_refs.append(ref)
+
         total = len(self.results)
-        valid_format = sum(1 for r in self.results if r.get("valid_format"))
-        exists = sum(1 for r in self.results if r.get("exists"))
         invalid_format = total - valid_format if valid_format else 0
         not_found = valid_format - exists if valid_format else total - exists
 
-        return {
+        summary = {
             "total_references": total,
             "valid_format": valid_format,
             "invalid_format": invalid_format,
@@ -308,6 +330,16 @@ class ReportGenerator:
             "not_found": not_found,
             "success_rate": (exists / total * 100) if total > 0 else 0,
         }
+        return summary, categories
+
+    def generate_summary(self) -> Dict:
+        """
+        Generate a summary report of the checking results
+
+        Returns:
+            Dictionary with summary statistics
+        """
+        return self._categorize_and_count()[0]
 
     def save_json(self, output_path: str):
         """
@@ -318,11 +350,17 @@ class ReportGenerator:
         """
         output_data = {
             "summary": self.generate_summary(),
-            "references": self.results,
+            "references": [dict(ref) for ref in self.results],
         }
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if _HAVE_ORJSON:
+            # orjson encodes straight to UTF-8 bytes with the same layout
+            options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(output_data, option=options))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
 
         print(f"✓ Detailed results saved to: {output_path}")
 
@@ -333,155 +371,50 @@ class ReportGenerator:
         Returns:
             Markdown-formatted report as string
         """
-        summary = self.generate_summary()
-
-        # Group references by category
-        verified_high = []
-        verified_medium = []
-        verified_low = []
-        not_found = []
-        errors = []
-        no_doi_or_title = []
-
-        for ref in self.results:
-            if ref.get("error"):
-                if "No DOI or title" in ref.get("error", ""):
-                    no_doi_or_title.append(ref)
-                else:
-                    errors.append(ref)
-            elif ref.get("exists"):
-                confidence = ref.get("confidence", "").lower()
-                if confidence == "high":
-                    verified_high.append(ref)
-                elif confidence == "medium":
-                    verified_medium.append(ref)
-                elif confidence == "low":
-                    verified_low.append(ref)
-                else:
-                    # DOI-based verification (no confidence level)
-                    verified_high.append(ref)
-            else:
-                not_found.append(ref)
+        # Summary statistics and references grouped by category
+        summary, categories = self._categorize_and_count()
+        not_found = categories["not_found"]
+        errors = categories["errors"]
+        no_doi_or_title = categories["no_doi_or_title"]
 
         # Build markdown report
-        md = []
-        md.append("# Reference Verification Report\n")
+        buf = io.StringIO()
+        buf.write("# Reference Verification Report\n\n")
 
         # Summary section
-        md.append("## Summary\n")
-        md.append(f"- **Total References**: {summary['total_references']}")
-        md.append(
-            f"- **Successfully Verified**: {summary['exists']} ({summary['success_rate']:.1f}%)"
+        buf.write("## Summary\n\n")
+        buf.write(f"- **Total References**: {summary['total_references']}\n")
+        buf.write(
+            f"- **Successfully Verified**: {summary['exists']} ({summary['success_rate']:.1f}%)\n"
         )
-        md.append(f"- **Not Found**: {len(not_found)}")
-        md.append(f"- **Errors**: {len(errors)}")
-        md.append(f"- **No DOI or Title**: {len(no_doi_or_title)}\n")
+        buf.write(f"- **Not Found**: {len(not_found)}\n")
+        buf.write(f"- **Errors**: {len(errors)}\n")
+        buf.write(f"- **No DOI or Title**: {len(no_doi_or_title)}\n\n")
 
         # Table of Contents
-        md.append("## Table of Contents\n")
-        if verified_high:
-            md.append(
-                f"- [✅ Verified References - High Confidence ({len(verified_high)})](#-verified-references---high-confidence-{len(verified_high)})"
-            )
-        if verified_medium:
-            md.append(
-                f"- [✅ Verified References - Medium Confidence ({len(verified_medium)})](#-verified-references---medium-confidence-{len(verified_medium)})"
-            )
-        if verified_low:
-            md.append(
-                f"- [⚠️ Verified References - Low Confidence ({len(verified_low)})](#️-verified-references---low-confidence-{len(verified_low)})"
-            )
-        if not_found:
-            md.append(
-                f"- [❌ Not Found ({len(not_found)})](#-not-found-{len(not_found)})"
-            )
-        if errors:
-            md.append(f"- [⚠️ Errors ({len(errors)})](#️-errors-{len(errors)})")
-        if no_doi_or_title:
-            md.append(
-                f"- [⚠️ Missing DOI and Title ({len(no_doi_or_title)})](#️-missing-doi-and-title-{len(no_doi_or_title)})"
-            )
-        md.append("\n---\n")
-
-        # Verified references - High confidence
-        if verified_high:
-            md.append(
-                f"## ✅ Verified References - High Confidence ({len(verified_high)})\n"
-            )
-            md.append("<details>")
-            md.append(
-                "<summary>These references were successfully matched with high confidence (click to expand)</summary>\n"
-            )
-            for i, ref in enumerate(verified_high, 1):
-                md.extend(self._render_verified_reference(ref, i))
-
-            md.append("</details>\n")
-
-        # Verified references - Medium confidence
-        if verified_medium:
-            md.append(
-                f"## ✅ Verified References - Medium Confidence ({len(verified_medium)})\n"
-            )
-            md.append("<details open>")
-            md.append(
-                "<summary>These references were matched with medium confidence. Manual verification recommended.</summary>\n"
-            )
-            for i, ref in enumerate(verified_medium, 1):
-                md.extend(self._render_verified_reference(ref, i))
-
-            md.append("</details>\n")
-
-        # Verified references - Low confidence
-        if verified_low:
-            md.append(
-                f"## ⚠️ Verified References - Low Confidence ({len(verified_low)})\n"
-            )
-            md.append("<details open>")
-            md.append(
-                "<summary>These references had matches, but confidence is low. Manual verification strongly recommended.</summary>\n"
-            )
-            for i, ref in enumerate(verified_low, 1):
-                md.extend(self._render_verified_reference(ref, i))
-
-            md.append("</details>\n")
-
-        # Not found references
-        if not_found:
-            md.append(f"## ❌ Not Found ({len(not_found)})\n")
-            md.append("<details open>")
-            md.append(
-                "<summary>These references could not be found in academic databases.</summary>\n"
-            )
-            for i, ref in enumerate(not_found, 1):
-                md.extend(self._render_not_found_reference(ref, i))
-
-            md.append("</details>\n")
-
-        # Errors
-        if errors:
-            md.append(f"## ⚠️ Errors ({len(errors)})\n")
-            md.append("<details open>")
-            md.append(
-                "<summary>These references encountered errors during verification.</summary>\n"
-            )
-            for i, ref in enumerate(errors, 1):
-                md.extend(self._render_error_reference(ref, i))
-
-            md.append("</details>\n")
-
-        # No DOI or Title
-        if no_doi_or_title:
-            md.append(f"## ⚠️ Missing DOI and Title ({len(no_doi_or_title)})\n")
-            md.append("<details open>")
-            md.append(
-                "<summary>These references could not be parsed - no DOI or title was extracted.</summary>\n"
-            )
-            for i, ref in enumerate(no_doi_or_title, 1):
-                md.extend(self._render_unparsed_reference(ref, i))
-
-            md.append("</details>\n")
-
-        return "\n".join(md)
+        buf.write("## Table of Contents\n\n")
+        for category, heading, anchor, _, _, _ in _REPORT_SECTIONS:
+            count = len(categories[category])
+            if count:
+                buf.write(f"- [{heading} ({count})](#{anchor}-{count})\n")
+        buf.write("\n---\n\n")
+
+        # One collapsible section per non-empty category
+        for category, heading, _, details_tag, summary_text, render in _REPORT_SECTIONS:
+            refs = categories[category]
+            if not refs:
+                continue
+            buf.write(f"## {heading} ({len(refs)})\n\n")
+            buf.write(f"{details_tag}\n")
+            buf.write(f"<summary>{summary_text}</summary>\n\n")
+            for i, ref in enumerate(refs, 1):
+                render(ref, i, buf)
+
+            buf.write(_DETAILS_CLOSE)
+
+        # Every line ends with a newline; drop the last one to match a
+        # newline-joined list of lines
+        return buf.getvalue()[:-1]
 
     def save_markdown(self, output_path: str):
         """
@@ -496,3 +429,58 @@ class ReportGenerator:
             f.write(markdown)
 
         print(f"✓ Markdown report saved to: {output_path}")
+
+
+# Report sections in display order, as (category, heading, heading anchor
+# without the count suffix, opening details tag, summary text, renderer).
+# Anchors of "⚠️" headings keep the emoji's invisible variation selector.
+_REPORT_SECTIONS = (
+    (
+        "verified_high",
+        "✅ Verified References - High Confidence",
+        "-verified-references---high-confidence",
+        "<details>",
+        "These references were successfully matched with high confidence (click to expand)",
+        ReportGenerator._render_verified_reference,
+    ),
+    (
+        "verified_medium",
+        "✅ Verified References - Medium Confidence",
+        "-verified-references---medium-confidence",
+        "<details open>",
+        "These references were matched with medium confidence. Manual verification recommended.",
+        ReportGenerator._render_verified_reference,
+    ),
+    (
+        "verified_low",
+        "⚠️ Verified References - Low Confidence",
+        "\ufe0f-verified-references---low-confidence",
+        "<details open>",
+        "These references had matches, but confidence is low. Manual verification strongly recommended.",
+        ReportGenerator._render_verified_reference,
+    ),
+    (
+        "not_found",
+        "❌ Not Found",
+        "-not-found",
+        "<details open>",
+        "These references could not be found in academic databases.",
+        ReportGenerator._render_not_found_reference,
+    ),
+    (
+        "errors",
+        "⚠️ Errors",
+        "\ufe0f-errors",
+        "<details open>",
+        "These references encountered errors during verification.",
+        ReportGenerator._render_error_reference,
+    ),
+    (
+        "no_doi_or_title",
+        "⚠️ Missing DOI and Title",
+        "\ufe0f-missing-doi-and-title",
+        "<details open>",
+        "These references could not be parsed - no DOI or title was extracted.",
+        ReportGenerator._render_unparsed_reference,
+    ),
+)
@@ -0,0 +1,150 @@
+"""
+Compact result records.
+
+This module defines RefResult, the object the checker returns for each
+reference. It stores the known result fields in __slots__ instead of a
+per-object hash table, while still behaving like the dictionaries the
+rest of the package (and existing callers) work with.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator
+
+# Known result fields, in the order they appear in reports
+_FIELDS = (
+    "doi",
+    "title",
+    "search_method",
+    "valid_format",
+    "exists",
+    "matched_title",
+    "authors",
+    "year",
+    "confidence",
+    "error",
+    "raw_text",
+)
+
+
+class RefResult(MutableMapping):
+    """
+    Check result for a single reference
+
+    Fields can be read as attributes (``r.exists``) or with dict syntax
+    (``r["exists"]``, ``r.get("confidence")``). A field that was never set
+    is absent from the mapping, just like a missing dictionary key, and
+    reads as None through attribute access. Keys outside the known fields
+    are kept in a small overflow dictionary.
+    """
+
+    __slots__ = _FIELDS + ("_extra",)
+
+    def __init__(self, **fields: Any):
+        """
+        Create a result from keyword fields
+
+        Args:
+            **fields: Initial result fields (e.g., doi="10.1234/x", exists=False)
+        """
+        self._extra = None
+        for key, value in fields.items():
+            self[key] = value
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when a slot is unset or the name is unknown
+        if name in _SLOT_DESCRIPTORS:
+            return None
+        raise AttributeError(name)
+
+    def __getitem__(self, key: str) -> Any:
+        descriptor = _SLOT_DESCRIPTORS.get(key)
+        if descriptor is None:
+            if self._extra is None:
+                raise KeyError(key)
+            return self._extra[key]
+        try:
+            return descriptor.__get__(self, RefResult)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        descriptor = _SLOT_DESCRIPTORS.get(key)
+        if descriptor is not None:
+            descriptor.__set__(self, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        descriptor = _SLOT_DESCRIPTORS.get(key)
+        if descriptor is None:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+            return
+        try:
+            descriptor.__delete__(self)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Direct slot access; Mapping.get() would go through __getitem__ and
+        # raise and catch a KeyError for every unset field
+        descriptor = _SLOT_DESCRIPTORS.get(key)
+        if descriptor is None:
+            if self._extra is None:
+                return default
+            return self._extra.get(key, default)
+        try:
+            return descriptor.__get__(self, RefResult)
+        except AttributeError:
+            return default
+
+    def __iter__(self) -> Iterator[str]:
+        for key in _FIELDS:
+            try:
+                _SLOT_DESCRIPTORS[key].__get__(self, RefResult)
+            except AttributeError:
+                continue
+            yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"RefResult({fields})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle only the fields that are set, so absent keys stay absent
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._extra = None
+        for key, value in state.items():
+            self[key] = value
+
+    def copy(self) -> "RefResult":
+        """
+        Create a shallow copy of this result
+
+        Returns:
+            New RefResult with the same fields
+        """
+        return RefResult(**self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the result to a plain dictionary (e.g., for JSON output)
+
+        Returns:
+            Dictionary with the fields that are set
+        """
+        return dict(self.items())
+
+
+# Slot descriptors for direct access that bypasses __getattr__
+_SLOT_DESCRIPTORS = {name: RefResult.__dict__[name] for name in _FIELDS}